@@ -0,0 +1,116 @@
+"""End-to-end controller benchmark against the local fake OMV server.
+
+Drives full OMVControllerData update cycles through the real
+OpenMediaVaultAPI transport. Run from the repository root:
+
+    python benchmarks/bench_controller.py --scale 100 --latency 0.02
+    python benchmarks/bench_controller.py --expire-sessions --cycles 20
+"""
+
+import argparse
+import asyncio
+import math
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_omv  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from custom_components.openmediavault.omv_controller import (  # noqa: E402
+    OMVControllerData,
+)
+
+
+# ---------------------------
+#   run_cycles
+# ---------------------------
+async def run_cycles(args, omv, port, config_dir) -> list:
+    """Run update cycles, return their durations and socket counters."""
+    hass = HomeAssistant(config_dir)
+    config_entry = SimpleNamespace(
+        entry_id="benchmark",
+        data={
+            "name": "OMV",
+            "host": f"127.0.0.1:{port}",
+            "username": args.username,
+            "password": args.password,
+            "ssl": False,
+            "verify_ssl": True,
+        },
+        options={"update_concurrency": args.concurrency},
+    )
+    controller = OMVControllerData(hass, config_entry)
+    await controller.async_hwinfo_update()
+    omv.reset_stats()
+
+    durations = []
+    for _ in range(args.cycles):
+        if args.expire_sessions:
+            omv.expire_sessions()
+
+        start = time.perf_counter()
+        await controller.async_update()
+        durations.append(time.perf_counter() - start)
+
+    connection_stats = dict(controller.api.connection_stats)
+    connection_stats["max_queued"] = controller.api.query_slots.stats["max_waiting"]
+    await controller.async_reset()
+    await hass.async_stop(force=True)
+    return durations, connection_stats
+
+
+# ---------------------------
+#   main
+# ---------------------------
+def main() -> int:
+    """Run benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--expire-sessions",
+        action="store_true",
+        help="invalidate all sessions before every cycle",
+    )
+    fake_omv.add_arguments(parser)
+    args = parser.parse_args()
+
+    omv = fake_omv.from_arguments(args)
+    server = fake_omv.start_server(omv)
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            durations, connection_stats = asyncio.run(
+                run_cycles(args, omv, server.server_port, config_dir)
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    stats = omv.snapshot()
+    calls = stats["calls"]
+    total = sum(durations)
+    ordered = sorted(durations)
+    print(f"cycles          {len(durations)}")
+    print(f"mean cycle      {statistics.mean(durations) * 1000:.1f} ms")
+    print(
+        f"p95 cycle       {ordered[math.ceil(len(ordered) * 0.95) - 1] * 1000:.1f} ms"
+    )
+    print(f"rpc/s           {calls.get('total', 0) / total:.1f}")
+    print(f"max in flight   {stats['max_in_flight']}")
+    print(f"max queued      {connection_stats['max_queued']}")
+    print(f"sockets created {connection_stats['created']}")
+    print(f"sockets reused  {connection_stats['reused']}")
+    for name in ("logins", "expired", "http_error", "rpc_error", "dropped"):
+        print(f"{name:<15} {calls.get(name, 0)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
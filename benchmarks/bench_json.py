@@ -0,0 +1,70 @@
+"""JSON encode/decode cost of rpc.php traffic, stdlib against the API codec.
+
+Run from the repository root:
+
+    python benchmarks/bench_json.py
+    python benchmarks/bench_json.py --scales 100 1000
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import payloads  # noqa: E402
+from bench_parser import measure  # noqa: E402
+from custom_components.openmediavault import omv_api  # noqa: E402
+
+DEFAULT_SCALES = [10, 100, 1000]
+
+
+# ---------------------------
+#   json_cases
+# ---------------------------
+def json_cases(scale) -> dict:
+    """Encoded rpc.php responses keyed by RPC name."""
+    responses = {
+        "DiskMgmt.enumerateDevices": payloads.disks(scale),
+        "Network.enumerateDevices": payloads.network(scale),
+        "compose.getContainerList": payloads.paged(payloads.containers(scale), {}),
+    }
+    return {
+        name: json.dumps({"response": response, "error": None}).encode()
+        for name, response in responses.items()
+    }
+
+
+# ---------------------------
+#   main
+# ---------------------------
+def main() -> int:
+    """Run benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    args = parser.parse_args()
+
+    backend = "orjson" if omv_api.orjson else "stdlib"
+    print(f"API codec backend: {backend}")
+    print(f"{'case':<36} {'KiB':>8} {'stdlib us':>10} {'codec us':>10} {'speedup':>8}")
+    for scale in args.scales:
+        for name, body in json_cases(scale).items():
+            data = json.loads(body)
+            for action, stdlib, codec, arg in (
+                ("decode", json.loads, omv_api.json_loads, body),
+                ("encode", json.dumps, omv_api.json_dumps, data),
+            ):
+                base = measure(lambda: stdlib(arg))["us"]
+                fast = measure(lambda: codec(arg))["us"]
+                print(
+                    f"{f'{action} {name}[{scale}]':<36} {len(body) / 1024:>8.1f}"
+                    f" {base:>10.1f} {fast:>10.1f} {base / fast:>7.1f}x"
+                )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""Microbenchmarks for apiparser and the OMVControllerData parse paths.
+
+Runs offline against synthetic RPC payloads, no NAS required.
+Run from the repository root:
+
+    python benchmarks/bench_parser.py
+    python benchmarks/bench_parser.py --scales 10 100 --save baseline.json
+    python benchmarks/bench_parser.py --compare baseline.json --threshold 1.25
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import payloads  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from custom_components.openmediavault.apiparser import (  # noqa: E402
+    fill_vals,
+    from_entry,
+    from_entry_bool,
+    get_uid,
+    parse_api,
+)
+from custom_components.openmediavault.omv_controller import (  # noqa: E402
+    OMVControllerData,
+    VALS_COMPOSE,
+    VALS_FS,
+    VALS_NETWORK,
+)
+
+DEFAULT_SCALES = [10, 100, 1000]
+MIN_TIME = 0.2
+
+
+# ---------------------------
+#   PayloadAPI
+# ---------------------------
+class PayloadAPI:
+    """Stand-in for OpenMediaVaultAPI answering from synthetic payloads."""
+
+    def __init__(self, scale):
+        """Initialize payload API."""
+        self.scale = scale
+        self._responses = {}
+
+    def connected(self) -> bool:
+        """Return connected boolean."""
+        return True
+
+    def has_reconnected(self) -> bool:
+        """Check if API has reconnected."""
+        return False
+
+    async def async_close(self) -> None:
+        """Release the HTTP session."""
+
+    async def async_query(self, service, method, params=None, options=None, **kwargs):
+        """Return pre-generated payload, generation is kept out of timings."""
+        key = (service, method, json.dumps(params, sort_keys=True))
+        if key not in self._responses:
+            self._responses[key] = payloads.rpc_response(
+                service, method, params, self.scale
+            )
+
+        return self._responses[key]
+
+
+# ---------------------------
+#   measure
+# ---------------------------
+def measure(func, setup=None) -> dict:
+    """Return mean time per call and peak allocation of one call."""
+    number = 1
+    while True:
+        elapsed = 0.0
+        for _ in range(number):
+            if setup:
+                setup()
+
+            start = time.perf_counter()
+            func()
+            elapsed += time.perf_counter() - start
+
+        if elapsed >= MIN_TIME or number >= 100000:
+            break
+
+        number *= 2 if elapsed == 0 else max(2, int(MIN_TIME / elapsed) + 1)
+
+    if setup:
+        setup()
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"us": elapsed / number * 1e6, "peak_kib": peak / 1024, "calls": number}
+
+
+# ---------------------------
+#   parser_cases
+# ---------------------------
+def parser_cases(scale) -> dict:
+    """Benchmarks for the apiparser functions."""
+    fs = payloads.filesystems(scale)
+    network = payloads.network(scale)
+    containers = payloads.containers(scale)
+    disks = payloads.disks(scale)
+    entry = network[0]
+    return {
+        "parse_api fs": lambda: parse_api(
+            data={},
+            source=fs,
+            key="uuid",
+            vals=VALS_FS,
+            skip=[{"name": "type", "value": "swap"}],
+        ),
+        "parse_api network": lambda: parse_api(
+            data={}, source=network, key="uuid", vals=VALS_NETWORK
+        ),
+        "parse_api compose": lambda: parse_api(
+            data={}, source=containers, key="name", vals=VALS_COMPOSE
+        ),
+        "from_entry": lambda: [
+            from_entry(tmp, "stats/rx_packets", default=0.0) for tmp in network
+        ],
+        "from_entry_bool": lambda: [
+            from_entry_bool(tmp, "isroot", default=False) for tmp in disks
+        ],
+        "fill_vals": lambda: fill_vals({"": {}}, entry, "", VALS_NETWORK),
+        "get_uid": lambda: [get_uid(tmp, "uuid", None, None, None) for tmp in network],
+    }
+
+
+# ---------------------------
+#   controller_cases
+# ---------------------------
+def controller_cases(controller, loop) -> dict:
+    """Benchmarks for the OMVControllerData getters."""
+
+    def run(method):
+        return lambda: loop.run_until_complete(method())
+
+    return {
+        "async_get_hwinfo": (run(controller.async_get_hwinfo), None),
+        "async_get_plugin": (run(controller.async_get_plugin), None),
+        "async_get_disk": (run(controller.async_get_disk), None),
+        "async_get_smart (cold)": (
+            run(controller.async_get_smart),
+            controller._smart_cache.clear,
+        ),
+        "async_get_smart (cached)": (run(controller.async_get_smart), None),
+        "async_get_fs": (run(controller.async_get_fs), None),
+        "async_get_network": (run(controller.async_get_network), None),
+        "async_get_service": (run(controller.async_get_service), None),
+        "async_get_kvm": (run(controller.async_get_kvm), None),
+        "async_get_compose": (run(controller.async_get_compose), None),
+        "collect_changes (unchanged)": (
+            controller.collect_changes,
+            lambda: controller._pending_changes.update(controller.data),
+        ),
+    }
+
+
+# ---------------------------
+#   create_controller
+# ---------------------------
+def create_controller(loop, config_dir, scale) -> OMVControllerData:
+    """Create a controller wired to the payload API."""
+
+    async def _create():
+        hass = HomeAssistant(config_dir)
+        config_entry = SimpleNamespace(
+            entry_id="benchmark",
+            data={
+                "name": "OMV",
+                "host": "127.0.0.1",
+                "username": "admin",
+                "password": "openmediavault",
+                "ssl": False,
+                "verify_ssl": True,
+            },
+            options={},
+        )
+        controller = OMVControllerData(hass, config_entry)
+        controller.api = PayloadAPI(scale)
+        return controller
+
+    return loop.run_until_complete(_create())
+
+
+# ---------------------------
+#   run_benchmarks
+# ---------------------------
+def run_benchmarks(scales) -> dict:
+    """Run all benchmarks and return results keyed by case and scale."""
+    results = {}
+    loop = asyncio.new_event_loop()
+    with tempfile.TemporaryDirectory() as config_dir:
+        for scale in scales:
+            for name, func in parser_cases(scale).items():
+                results[f"{name}[{scale}]"] = measure(func)
+
+            controller = create_controller(loop, config_dir, scale)
+            loop.run_until_complete(controller.async_get_disk())
+            loop.run_until_complete(controller.async_get_plugin())
+            for name, (func, setup) in controller_cases(controller, loop).items():
+                results[f"{name}[{scale}]"] = measure(func, setup)
+
+    loop.close()
+    return results
+
+
+# ---------------------------
+#   main
+# ---------------------------
+def main() -> int:
+    """Run benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--save", help="write results to a JSON file")
+    parser.add_argument("--compare", help="compare against a saved JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="fail when a case is slower than baseline by this factor",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.scales)
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else {}
+
+    regressions = []
+    print(f"{'case':<36} {'us/call':>12} {'peak KiB':>10} {'vs base':>8}")
+    for name, result in results.items():
+        ratio = ""
+        if name in baseline:
+            factor = result["us"] / baseline[name]["us"]
+            ratio = f"{factor:.2f}x"
+            if factor > args.threshold:
+                regressions.append(name)
+
+        print(
+            f"{name:<36} {result['us']:>12.1f} {result['peak_kib']:>10.1f} {ratio:>8}"
+        )
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2))
+
+    if regressions:
+        print(f"Regressions over {args.threshold}x: {', '.join(regressions)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+"""Local stand-in for the OpenMediaVault rpc.php endpoint.
+
+Answers the RPCs used by the integration from synthetic payloads, with
+configurable latency, payload scale, session expiry and error injection.
+Run from the repository root:
+
+    python benchmarks/fake_omv.py --port 8080 --scale 100 --latency 0.05
+
+and point the integration at 127.0.0.1:8080 with any password matching
+--password. GET /stats returns call counters as JSON.
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import payloads  # noqa: E402
+
+SESSION_COOKIE = "X-OPENMEDIAVAULT-SESSIONID"
+
+
+# ---------------------------
+#   FakeOMV
+# ---------------------------
+class FakeOMV:
+    """RPC state machine shared by all request handler threads."""
+
+    def __init__(
+        self,
+        scale=10,
+        latency=0.0,
+        jitter=0.0,
+        session_ttl=0.0,
+        expire_every=0,
+        error_rate=0.0,
+        rpc_error_rate=0.0,
+        drop_rate=0.0,
+        standby=(),
+        username="admin",
+        password="openmediavault",
+        seed=None,
+    ):
+        """Initialize fake OMV."""
+        self.scale = scale
+        self.latency = latency
+        self.jitter = jitter
+        self.session_ttl = session_ttl
+        self.expire_every = expire_every
+        self.error_rate = error_rate
+        self.rpc_error_rate = rpc_error_rate
+        self.drop_rate = drop_rate
+        self.standby = set(standby)
+        self.username = username
+        self.password = password
+
+        self.lock = threading.Lock()
+        self.random = random.Random(seed)
+        self.sessions = {}
+        self.stats = Counter()
+        self.counter = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    # ---------------------------
+    #   expire_sessions
+    # ---------------------------
+    def expire_sessions(self) -> None:
+        """Invalidate all sessions, next query of every client fails."""
+        with self.lock:
+            self.sessions.clear()
+
+    # ---------------------------
+    #   reset_stats
+    # ---------------------------
+    def reset_stats(self) -> None:
+        """Reset call counters."""
+        with self.lock:
+            self.stats.clear()
+            self.max_in_flight = self.in_flight
+
+    # ---------------------------
+    #   snapshot
+    # ---------------------------
+    def snapshot(self) -> dict:
+        """Return counters as a plain dict."""
+        with self.lock:
+            return {
+                "calls": dict(self.stats),
+                "sessions": len(self.sessions),
+                "max_in_flight": self.max_in_flight,
+            }
+
+    # ---------------------------
+    #   handle
+    # ---------------------------
+    def handle(self, body, session_id) -> tuple:
+        """Process one RPC, return (status, payload, new session id)."""
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            delay = self.latency + self.random.uniform(0, self.jitter)
+            if delay:
+                time.sleep(delay)
+
+            return self._handle(body, session_id)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def _handle(self, body, session_id) -> tuple:
+        """Process one RPC without latency accounting."""
+        try:
+            request = json.loads(body)
+            service = request["service"]
+            method = request["method"]
+        except (ValueError, KeyError, TypeError):
+            return 400, None, None
+
+        name = f"{service}.{method}"
+        with self.lock:
+            self.stats[name] += 1
+            self.stats["total"] += 1
+            roll = self.random.random()
+            if roll < self.drop_rate:
+                self.stats["dropped"] += 1
+                return None, None, None
+
+            if roll < self.drop_rate + self.error_rate:
+                self.stats["http_error"] += 1
+                return 500, None, None
+
+        if service == "session" and method == "login":
+            return self._login(request.get("params") or {})
+
+        with self.lock:
+            if not self._session_valid(session_id):
+                self.stats["expired"] += 1
+                return 200, rpc_error(5001, "Session not authenticated."), None
+
+            if self.random.random() < self.rpc_error_rate:
+                self.stats["rpc_error"] += 1
+                return 200, rpc_error(9000, f"Injected failure in {name}"), None
+
+            if service == "Network" and method == "enumerateDevices":
+                self.counter += 1
+
+            counter = self.counter
+
+        try:
+            response = payloads.rpc_response(
+                service,
+                method,
+                request.get("params"),
+                self.scale,
+                counter=counter,
+                standby=self.standby,
+            )
+        except KeyError:
+            return 200, rpc_error(9000, f"Unknown RPC {name}"), None
+
+        return 200, {"response": response, "error": None}, None
+
+    def _login(self, params) -> tuple:
+        """Authenticate and open a new session."""
+        if (
+            params.get("username") != self.username
+            or params.get("password") != self.password
+        ):
+            return 200, rpc_error(5001, "Incorrect username or password."), None
+
+        session_id = uuid4().hex
+        with self.lock:
+            self.stats["logins"] += 1
+            self.sessions[session_id] = {"created": time.monotonic(), "queries": 0}
+
+        return (
+            200,
+            {
+                "response": {
+                    "authenticated": True,
+                    "username": params["username"],
+                    "permissions": {"role": "admin"},
+                },
+                "error": None,
+            },
+            session_id,
+        )
+
+    def _session_valid(self, session_id) -> bool:
+        """Check and account session, called with lock held."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            return False
+
+        session["queries"] += 1
+        if (
+            self.session_ttl
+            and time.monotonic() - session["created"] > self.session_ttl
+        ) or (self.expire_every and session["queries"] > self.expire_every):
+            del self.sessions[session_id]
+            return False
+
+        return True
+
+
+# ---------------------------
+#   rpc_error
+# ---------------------------
+def rpc_error(code, message) -> dict:
+    """Return OMV error envelope"""
+    return {
+        "response": None,
+        "error": {"code": code, "message": message, "trace": ""},
+    }
+
+
+# ---------------------------
+#   RPCHandler
+# ---------------------------
+class RPCHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 keep-alive handler for rpc.php."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        """Handle RPC request."""
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.split("?")[0] != "/rpc.php":
+            self._send(404, None)
+            return
+
+        session_id = None
+        for cookie in self.headers.get_all("Cookie", []):
+            for part in cookie.split(";"):
+                key, _, value = part.strip().partition("=")
+                if key == SESSION_COOKIE:
+                    session_id = value
+
+        status, data, new_session = self.server.omv.handle(body, session_id)
+        if status is None:
+            self.close_connection = True
+            return
+
+        self._send(status, data, new_session)
+
+    def do_GET(self):
+        """Return counters."""
+        if self.path == "/stats":
+            self._send(200, self.server.omv.snapshot())
+        else:
+            self._send(404, None)
+
+    def _send(self, status, data, session_id=None):
+        """Write JSON response."""
+        payload = json.dumps(data).encode() if data is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if session_id:
+            self.send_header(
+                "Set-Cookie", f"{SESSION_COOKIE}={session_id}; path=/; HttpOnly"
+            )
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        """Silence per-request logging."""
+
+
+# ---------------------------
+#   FakeOMVServer
+# ---------------------------
+class FakeOMVServer(ThreadingHTTPServer):
+    """Threaded HTTP server carrying a FakeOMV instance."""
+
+    daemon_threads = True
+
+    def __init__(self, address, omv):
+        """Initialize server."""
+        self.omv = omv
+        super().__init__(address, RPCHandler)
+
+
+# ---------------------------
+#   start_server
+# ---------------------------
+def start_server(omv, host="127.0.0.1", port=0) -> FakeOMVServer:
+    """Serve omv from a background thread, port 0 picks a free port."""
+    server = FakeOMVServer((host, port), omv)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ---------------------------
+#   add_arguments
+# ---------------------------
+def add_arguments(parser) -> None:
+    """Add FakeOMV options to an argument parser."""
+    parser.add_argument("--scale", type=int, default=10, help="devices per list")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per RPC")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay")
+    parser.add_argument(
+        "--session-ttl", type=float, default=0.0, help="session lifetime in seconds"
+    )
+    parser.add_argument(
+        "--expire-every", type=int, default=0, help="expire session after N queries"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="fraction of HTTP 500 replies"
+    )
+    parser.add_argument(
+        "--rpc-error-rate", type=float, default=0.0, help="fraction of RPC errors"
+    )
+    parser.add_argument(
+        "--drop-rate", type=float, default=0.0, help="fraction of dropped connections"
+    )
+    parser.add_argument(
+        "--standby", type=int, nargs="*", default=[], help="disk indexes in standby"
+    )
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="openmediavault")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+# ---------------------------
+#   from_arguments
+# ---------------------------
+def from_arguments(args) -> FakeOMV:
+    """Create FakeOMV from parsed arguments."""
+    return FakeOMV(
+        scale=args.scale,
+        latency=args.latency,
+        jitter=args.jitter,
+        session_ttl=args.session_ttl,
+        expire_every=args.expire_every,
+        error_rate=args.error_rate,
+        rpc_error_rate=args.rpc_error_rate,
+        drop_rate=args.drop_rate,
+        standby=args.standby,
+        username=args.username,
+        password=args.password,
+        seed=args.seed,
+    )
+
+
+# ---------------------------
+#   main
+# ---------------------------
+def main() -> int:
+    """Run fake OMV from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeOMVServer((args.host, args.port), from_arguments(args))
+    print(f"Serving fake OMV on http://{args.host}:{server.server_port}/rpc.php")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
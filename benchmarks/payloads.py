@@ -0,0 +1,305 @@
+"""Synthetic OpenMediaVault RPC payloads for benchmarks and the fake RPC server."""
+
+SMART_ATTRIBUTE_NAMES = [
+    "Raw_Read_Error_Rate",
+    "Spin_Up_Time",
+    "Start_Stop_Count",
+    "Reallocated_Sector_Ct",
+    "Seek_Error_Rate",
+    "Power_On_Hours",
+    "Spin_Retry_Count",
+    "Power_Cycle_Count",
+    "Load_Cycle_Count",
+    "Temperature_Celsius",
+    "UDMA_CRC_Error_Count",
+    "Multi_Zone_Error_Rate",
+]
+
+
+# ---------------------------
+#   devicename
+# ---------------------------
+def devicename(index) -> str:
+    """Return sdX style device name for index (sda, ..., sdz, sdaa, ...)"""
+    name = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        name = chr(97 + rem) + name
+
+    return f"sd{name}"
+
+
+# ---------------------------
+#   system_information
+# ---------------------------
+def system_information(version="7.0.4-1") -> dict:
+    """System.getInformation"""
+    return {
+        "ts": 1700000000,
+        "time": "Tue 14 Nov 2023 22:13:20",
+        "hostname": "omv",
+        "version": version,
+        "cpuModelName": "Intel(R) Celeron(R) J4125 CPU @ 2.00GHz",
+        "cpuUsage": 7.352941176470588,
+        "memTotal": 8200413184,
+        "memFree": 4920000000,
+        "memUsed": 3280413184,
+        "memAvailable": 6100000000,
+        "memUtilization": 0.4,
+        "kernel": "Linux 6.1.0-13-amd64",
+        "uptime": 1234567.89,
+        "loadAverage": {"1min": 0.41, "5min": 0.52, "15min": 0.48},
+        "configDirty": False,
+        "rebootRequired": False,
+        "availablePkgUpdates": 3,
+        "displayWelcomeMessage": False,
+    }
+
+
+# ---------------------------
+#   plugins
+# ---------------------------
+def plugins() -> list:
+    """Plugin.enumeratePlugins"""
+    return [
+        {"name": "openmediavault-kvm", "version": "7.0.3", "installed": True},
+        {"name": "openmediavault-compose", "version": "7.1.1", "installed": True},
+        {"name": "openmediavault-omvextrasorg", "installed": True},
+        {"name": "openmediavault-zfs", "installed": False},
+    ]
+
+
+# ---------------------------
+#   disks
+# ---------------------------
+def disks(count) -> list:
+    """DiskMgmt.enumerateDevices"""
+    return [
+        {
+            "devicename": devicename(i),
+            "devicefile": f"/dev/{devicename(i)}",
+            "canonicaldevicefile": f"/dev/{devicename(i)}",
+            "devicelinks": [f"/dev/disk/by-id/ata-WDC_WD40EFRX_WD-WCC{i:07d}"],
+            "model": "WDC WD40EFRX-68N32N0",
+            "size": "4000787030016",
+            "description": f"WDC WD40EFRX-68N32N0 [/dev/{devicename(i)}, 3.63 TiB]",
+            "vendor": "ATA",
+            "serialnumber": f"WD-WCC{i:07d}",
+            "wwn": f"0x50014ee2{i:08x}",
+            "israid": False,
+            "isroot": i == 0,
+            "isreadonly": False,
+        }
+        for i in range(count)
+    ]
+
+
+# ---------------------------
+#   smart_list
+# ---------------------------
+def smart_list(count, standby=()) -> dict:
+    """Smart.getList"""
+    data = [
+        {
+            "devicename": devicename(i),
+            "devicefile": f"/dev/{devicename(i)}",
+            "model": "WDC WD40EFRX-68N32N0",
+            "size": "4000787030016",
+            "temperature": "" if i in standby else 30 + i % 15,
+            "description": f"WDC WD40EFRX-68N32N0 [/dev/{devicename(i)}, 3.63 TiB]",
+            "vendor": "ATA",
+            "serialnumber": f"WD-WCC{i:07d}",
+            "wwn": f"0x50014ee2{i:08x}",
+            "overallstatus": "GOOD",
+            "monitor": True,
+        }
+        for i in range(count)
+    ]
+    return {"total": len(data), "data": data}
+
+
+# ---------------------------
+#   smart_attributes
+# ---------------------------
+def smart_attributes() -> list:
+    """Smart.getAttributes"""
+    return [
+        {
+            "id": index + 1,
+            "attrname": name,
+            "flags": "POSR-K",
+            "value": 200,
+            "worst": 200,
+            "threshold": 51 if index == 0 else 0,
+            "whenfailed": "-",
+            "rawvalue": "0 (0 0)" if index % 3 else str(index * 17),
+            "assessment": "good",
+        }
+        for index, name in enumerate(SMART_ATTRIBUTE_NAMES)
+    ]
+
+
+# ---------------------------
+#   filesystems
+# ---------------------------
+def filesystems(count) -> list:
+    """FileSystemMgmt.enumerateFilesystems"""
+    data = [
+        {
+            "devicename": f"mapper/{devicename(i)}1-crypt" if i % 4 else devicename(i),
+            "devicefile": f"/dev/{devicename(i)}1",
+            "parentdevicefile": f"/dev/{devicename(i)}",
+            "uuid": f"3c0e5e2a-{i:04x}-4a31-9f6d-1b2c3d4e5f60",
+            "label": f"data{i}",
+            "type": "ext4",
+            "blocks": "3844640564",
+            "mounted": True,
+            "mountpoint": f"/srv/dev-disk-by-uuid-{i}",
+            "used": "1.2 TiB",
+            "available": "2791519686656",
+            "size": "3936911937536",
+            "percentage": 29,
+            "description": f"data{i} (2.54 TiB available)",
+            "propposixacl": True,
+            "propquota": True,
+            "propresize": True,
+            "propfstab": True,
+            "propcompress": False,
+            "propautodefrag": False,
+            "hasmultipledevices": False,
+            "devicefiles": [f"/dev/{devicename(i)}1"],
+            "comment": "",
+            "_readonly": False,
+            "_used": True,
+            "propreadonly": False,
+        }
+        for i in range(count)
+    ]
+    data.append({"devicename": "sdz9", "uuid": "swap", "type": "swap"})
+    return data
+
+
+# ---------------------------
+#   network
+# ---------------------------
+def network(count, counter=0) -> list:
+    """Network.enumerateDevices"""
+    data = [
+        {
+            "uuid": f"0c9ee6a2-{i:04x}-4f6b-8d3b-2b1a0c9d8e7f",
+            "devicename": f"eth{i}",
+            "type": "ethernet",
+            "method": "dhcp",
+            "address": f"10.0.{i // 250}.{i % 250 + 2}",
+            "netmask": "255.255.255.0",
+            "gateway": "10.0.0.1",
+            "method6": "manual",
+            "mtu": "1500",
+            "wol": False,
+            "link": True,
+            "ether": "00:11:32:aa:bb:cc",
+            "speed": 1000,
+            "stats": {
+                "rx_packets": 1000000 + counter * (i + 1),
+                "tx_packets": 500000 + counter * (i + 1),
+            },
+        }
+        for i in range(count)
+    ]
+    data.append({"uuid": "lo", "devicename": "lo", "type": "loopback"})
+    return data
+
+
+# ---------------------------
+#   services
+# ---------------------------
+def services(count) -> dict:
+    """Services.getStatus"""
+    data = [
+        {
+            "name": f"service{i}",
+            "title": f"Service {i}",
+            "enabled": i % 2 == 0,
+            "running": i % 3 != 0,
+        }
+        for i in range(count)
+    ]
+    return {"total": len(data), "data": data}
+
+
+# ---------------------------
+#   vms
+# ---------------------------
+def vms(count) -> list:
+    """Kvm.getVmList records"""
+    return [
+        {
+            "vmname": f"vm{i}",
+            "virttype": "kvm",
+            "mem": 2097152,
+            "cpu": 2,
+            "state": "running" if i % 2 else "shutoff",
+            "arch": "x86_64",
+            "autostart": "Yes" if i % 3 == 0 else "No",
+            "vncexists": True,
+            "spiceexists": False,
+            "vncport": 5900 + i,
+            "snaps": i % 4,
+        }
+        for i in range(count)
+    ]
+
+
+# ---------------------------
+#   containers
+# ---------------------------
+def containers(count) -> list:
+    """compose.getContainerList records"""
+    return [
+        {
+            "name": f"project{i // 4}-service{i % 4}-1",
+            "image": f"ghcr.io/example/service{i % 4}:latest",
+            "project": f"project{i // 4}",
+            "service": f"service{i % 4}",
+            "created": "2023-11-14 22:13:20 +0000 UTC",
+            "state": "running" if i % 5 else "exited",
+            "status": "Up 3 days",
+            "ports": "0.0.0.0:8080->80/tcp",
+        }
+        for i in range(count)
+    ]
+
+
+# ---------------------------
+#   paged
+# ---------------------------
+def paged(records, params) -> dict:
+    """Slice records the way OMV list RPCs honour start/limit"""
+    start = params.get("start", 0) if params else 0
+    limit = params.get("limit", -1) if params else -1
+    page = records[start:] if limit < 0 else records[start : start + limit]
+    return {"total": len(records), "data": page}
+
+
+# ---------------------------
+#   rpc_response
+# ---------------------------
+def rpc_response(service, method, params, scale, counter=0, standby=()):
+    """Return the response of a supported RPC, KeyError if unknown"""
+    handlers = {
+        ("System", "getInformation"): lambda: system_information(),
+        ("System", "noop"): lambda: None,
+        ("Plugin", "enumeratePlugins"): lambda: plugins(),
+        ("DiskMgmt", "enumerateDevices"): lambda: disks(scale),
+        ("Smart", "getList"): lambda: paged(smart_list(scale, standby)["data"], params),
+        ("Smart", "getAttributes"): lambda: smart_attributes(),
+        ("FileSystemMgmt", "enumerateFilesystems"): lambda: filesystems(scale),
+        ("Network", "enumerateDevices"): lambda: network(scale, counter),
+        ("Services", "getStatus"): lambda: services(scale),
+        ("Kvm", "getVmList"): lambda: paged(vms(scale), params),
+        ("Kvm", "doCommand"): lambda: None,
+        ("Kvm", "addSnapshot"): lambda: None,
+        ("compose", "getContainerList"): lambda: paged(containers(scale), params),
+    }
+    return handlers[(service, method)]()
@@ -4,10 +4,16 @@ from pytz import utc
 from logging import getLogger
 from datetime import datetime
 from voluptuous import Optional
-from homeassistant.components.diagnostics import async_redact_data
 from .const import TO_REDACT
+from .helper import DebugTrace, LazyRedact, profiled
 
 _LOGGER = getLogger(__name__)
+_TRACE = DebugTrace("parser")
+
+_MISSING = object()
+
+# Key flagging a uid missing from the last response of its source
+MISSING_FLAG = "_missing"
 
 
 # ---------------------------
@@ -19,71 +25,121 @@ def utc_from_timestamp(timestamp: float) -> datetime:
 
 
 # ---------------------------
-#   from_entry
+#   CompiledVals
 # ---------------------------
-def from_entry(entry, param, default="") -> str:
-    """Validate and return str value an API dict"""
-    if "/" in param:
-        for tmp_param in param.split("/"):
-            if isinstance(entry, dict) and tmp_param in entry:
-                entry = entry[tmp_param]
-                ret = entry
-            else:
-                ret = default
-                break
+class CompiledVals(tuple):
+    """Vals definitions with accessors bound ahead of time"""
+
+
+# ---------------------------
+#   CompiledEnsureVals
+# ---------------------------
+class CompiledEnsureVals(tuple):
+    """Ensure_vals definitions with defaults bound ahead of time"""
+
+
+# ---------------------------
+#   split_source
+# ---------------------------
+def split_source(param) -> tuple | None:
+    """Split source path into keys, None for plain keys"""
+    return tuple(param.split("/")) if "/" in param else None
+
+
+# ---------------------------
+#   lookup_entry
+# ---------------------------
+def lookup_entry(entry, param, path, default):
+    """Return value at param or path in entry, default if not found"""
+    if path is None:
+        return entry[param] if param in entry else default
+
+    for tmp_param in path:
+        if isinstance(entry, dict) and tmp_param in entry:
+            entry = entry[tmp_param]
+        else:
+            return default
+
+    return entry
 
-    elif param in entry:
-        ret = entry[param]
-    else:
-        ret = default
 
+# ---------------------------
+#   convert_str
+# ---------------------------
+def convert_str(ret):
+    """Convert value to str"""
+    return str(ret)
+
+
+# ---------------------------
+#   convert_int
+# ---------------------------
+def convert_int(ret):
+    """Convert value to int"""
+    if not isinstance(ret, int):
+        if ret == "":
+            ret = 0
+
+        try:
+            ret = int(ret)
+        except Exception:
+            ret = re.search(r"[0-9]+", ret)
+            ret = ret.group() if ret else 0
+
+    return ret
+
+
+# ---------------------------
+#   convert_float
+# ---------------------------
+def convert_float(ret):
+    """Convert value to rounded float"""
+    if not isinstance(ret, float):
+        if ret == "":
+            ret = 0
+
+        try:
+            ret = float(ret)
+        except Exception:
+            ret = re.search(r"[0-9]+[.,]?[0-9]*", ret)
+            ret = ret.group() if ret else 0
+
+    return round(ret, 2)
+
+
+# ---------------------------
+#   value_converter
+# ---------------------------
+def value_converter(default) -> Optional(callable):
+    """Return converter matching the type of default"""
     if default != "":
         if isinstance(default, str):
-            ret = str(ret)
+            return convert_str
         elif isinstance(default, int):
-            if not isinstance(ret, int):
-                if ret == "":
-                    ret = 0
-
-                try:
-                    ret = int(ret)
-                except Exception:
-                    ret = re.search(r"[0-9]+", ret)
-                    ret = ret.group() if ret else 0
+            return convert_int
         elif isinstance(default, float):
-            if not isinstance(ret, float):
-                if ret == "":
-                    ret = 0
+            return convert_float
 
-                try:
-                    ret = float(ret)
-                except Exception:
-                    ret = re.search(r"[0-9]+[.,]?[0-9]*", ret)
-                    ret = ret.group() if ret else 0
+    return None
 
-            ret = round(ret, 2)
+
+# ---------------------------
+#   from_entry
+# ---------------------------
+def from_entry(entry, param, default="") -> str:
+    """Validate and return str value an API dict"""
+    ret = lookup_entry(entry, param, split_source(param), default)
+    if converter := value_converter(default):
+        ret = converter(ret)
 
     return ret[:255] if isinstance(ret, str) and len(ret) > 255 else ret
 
 
 # ---------------------------
-#   from_entry_bool
+#   bool_from_value
 # ---------------------------
-def from_entry_bool(entry, param, default=False, reverse=False) -> bool:
-    """Validate and return a bool value from an API dict"""
-    if "/" in param:
-        for tmp_param in param.split("/"):
-            if isinstance(entry, dict) and tmp_param in entry:
-                entry = entry[tmp_param]
-            else:
-                return default
-
-        ret = entry
-    elif param in entry:
-        ret = entry[param]
-    else:
-        return default
-
+def bool_from_value(ret, default=False, reverse=False) -> bool:
+    """Validate and return a bool value"""
     if isinstance(ret, str):
         if ret in ("on", "On", "ON", "yes", "Yes", "YES", "up", "Up", "UP"):
             ret = True
@@ -99,9 +155,115 @@ def from_entry_bool(entry, param, default=False, reverse=False) -> bool:
     return ret
 
 
+# ---------------------------
+#   from_entry_bool
+# ---------------------------
+def from_entry_bool(entry, param, default=False, reverse=False) -> bool:
+    """Validate and return a bool value from an API dict"""
+    ret = lookup_entry(entry, param, split_source(param), _MISSING)
+    if ret is _MISSING:
+        return default
+
+    return bool_from_value(ret, default, reverse)
+
+
+# ---------------------------
+#   compile_lookup
+# ---------------------------
+def compile_lookup(param, default):
+    """Return lookup for param with the source path split ahead of time"""
+    path = split_source(param)
+    if path is None:
+        return lambda entry: entry[param] if param in entry else default
+
+    return lambda entry: lookup_entry(entry, param, path, default)
+
+
+# ---------------------------
+#   compile_str_accessor
+# ---------------------------
+def compile_str_accessor(param, default):
+    """Return accessor for a str type value"""
+    lookup = compile_lookup(param, default)
+    converter = value_converter(default)
+
+    def accessor(entry):
+        ret = lookup(entry)
+        if converter:
+            ret = converter(ret)
+
+        return ret[:255] if isinstance(ret, str) and len(ret) > 255 else ret
+
+    return accessor
+
+
+# ---------------------------
+#   compile_bool_accessor
+# ---------------------------
+def compile_bool_accessor(param, default, reverse):
+    """Return accessor for a bool type value"""
+    lookup = compile_lookup(param, _MISSING)
+
+    def accessor(entry):
+        ret = lookup(entry)
+        if ret is _MISSING:
+            return default
+
+        return bool_from_value(ret, default, reverse)
+
+    return accessor
+
+
+# ---------------------------
+#   compile_vals
+# ---------------------------
+def compile_vals(vals) -> CompiledVals:
+    """Compile vals definitions into (name, accessor, convert) tuples"""
+    if isinstance(vals, CompiledVals):
+        return vals
+
+    compiled = []
+    for val in vals:
+        _name = val["name"]
+        _type = val["type"] if "type" in val else "str"
+        _source = val["source"] if "source" in val else _name
+        _convert = val["convert"] if "convert" in val else None
+
+        if _type == "str":
+            _default = val["default"] if "default" in val else ""
+            if "default_val" in val and val["default_val"] in val:
+                _default = val[val["default_val"]]
+
+            accessor = compile_str_accessor(_source, _default)
+        elif _type == "bool":
+            _default = val["default"] if "default" in val else False
+            _reverse = val["reverse"] if "reverse" in val else False
+            accessor = compile_bool_accessor(_source, _default, _reverse)
+        else:
+            continue
+
+        compiled.append((_name, accessor, _convert == "utc_from_timestamp"))
+
+    return CompiledVals(compiled)
+
+
+# ---------------------------
+#   compile_ensure_vals
+# ---------------------------
+def compile_ensure_vals(ensure_vals) -> CompiledEnsureVals:
+    """Compile ensure_vals definitions into (name, default) tuples"""
+    if isinstance(ensure_vals, CompiledEnsureVals):
+        return ensure_vals
+
+    return CompiledEnsureVals(
+        (val["name"], val["default"] if "default" in val else "") for val in ensure_vals
+    )
+
+
 # ---------------------------
 #   parse_api
 # ---------------------------
+@profiled("parse")
 def parse_api(
     data=None,
     source=None,
@@ -113,44 +275,41 @@ def parse_api(
     ensure_vals=None,
     only=None,
     skip=None,
+    purge=False,
 ) -> dict:
-    """Get data from API"""
-    debug = _LOGGER.getEffectiveLevel() == 10
+    """Get data from API
+
+    With purge, uids missing from a successfully retrieved source are
+    flagged with MISSING_FLAG.
+    """
+    vals = compile_vals(vals) if vals else vals
+    ensure_vals = compile_ensure_vals(ensure_vals) if ensure_vals else ensure_vals
+    keyed = bool(key or key_search)
     if type(source) == dict:
-        tmp = source
-        source = [tmp]
+        source = [source]
 
     if not source:
-        if not key and not key_search:
-            data = fill_defaults(data, vals)
-        return data
+        return parse_empty(data, source, vals, keyed, purge)
 
-    if debug:
-        _LOGGER.debug("Processing source %s", async_redact_data(source, TO_REDACT))
+    if _TRACE.enabled():
+        trace_source(source)
 
     keymap = generate_keymap(data, key_search)
+    seen = set()
     for entry in source:
-        if only and not matches_only(entry, only):
-            continue
-
-        if skip and can_skip(entry, skip):
+        if not entry_included(entry, only, skip):
             continue
 
         uid = None
-        if key or key_search:
-            uid = get_uid(entry, key, key_secondary, key_search, keymap)
+        if keyed:
+            uid = entry_uid(entry, key, key_secondary, key_search, keymap)
             if not uid:
-                # ZFS filesystems don't have a UUID, so use devicefile instead.
-                if "type" in entry and entry["type"] == "zfs":
-                    uid = entry["devicefile"]
-                    entry["uuid"] = uid
-                else:
-                    continue
+                continue
+
             if uid not in data:
                 data[uid] = {}
 
-        if debug:
-            _LOGGER.debug("Processing entry %s", async_redact_data(entry, TO_REDACT))
+            seen.add(uid)
 
         if vals:
             data = fill_vals(data, entry, uid, vals)
@@ -161,9 +320,79 @@ def parse_api(
         if val_proc:
             data = fill_vals_proc(data, uid, val_proc)
 
+    if purge and keyed:
+        flag_missing(data, seen)
+
+    return data
+
+
+# ---------------------------
+#   parse_empty
+# ---------------------------
+def parse_empty(data, source, vals, keyed, purge) -> dict:
+    """Handle a source without entries
+
+    An empty list flags all uids when purging, a failed query keeps them.
+    """
+    if purge and keyed and isinstance(source, list):
+        flag_missing(data, ())
+    elif not keyed:
+        data = fill_defaults(data, vals)
+
     return data
 
 
+# ---------------------------
+#   trace_source
+# ---------------------------
+def trace_source(source) -> None:
+    """Trace a source and its entries"""
+    _TRACE("Processing source %s", LazyRedact(source, TO_REDACT))
+    for entry in source:
+        _TRACE("Processing entry %s", LazyRedact(entry, TO_REDACT))
+
+
+# ---------------------------
+#   entry_included
+# ---------------------------
+def entry_included(entry, only, skip) -> bool:
+    """Return False if the entry is filtered out by only or skip"""
+    if only and not matches_only(entry, only):
+        return False
+
+    return not (skip and can_skip(entry, skip))
+
+
+# ---------------------------
+#   entry_uid
+# ---------------------------
+def entry_uid(entry, key, key_secondary, key_search, keymap) -> Optional(str):
+    """Get UID of an entry"""
+    uid = get_uid(entry, key, key_secondary, key_search, keymap)
+    if not uid and entry.get("type") == "zfs":
+        # ZFS filesystems don't have a UUID, so use devicefile instead.
+        uid = entry["devicefile"]
+        entry["uuid"] = uid
+
+    return uid
+
+
+# ---------------------------
+#   flag_missing
+# ---------------------------
+def flag_missing(data, seen) -> None:
+    """Flag uids not in seen as missing and clear the flag of the others.
+
+    The dicts of missing uids are kept, entities hold references to them
+    and show current values again once the uid reappears.
+    """
+    for uid, vals in data.items():
+        if uid in seen:
+            vals.pop(MISSING_FLAG, None)
+        else:
+            vals[MISSING_FLAG] = True
+
+
 # ---------------------------
 #   get_uid
 # ---------------------------
@@ -244,26 +473,9 @@ def can_skip(entry, skip) -> bool:
 # ---------------------------
 def fill_defaults(data, vals) -> dict:
     """Fill defaults if source is not present"""
-    for val in vals:
-        _name = val["name"]
-        _type = val["type"] if "type" in val else "str"
-        _source = val["source"] if "source" in val else _name
-
-        if _type == "str":
-            _default = val["default"] if "default" in val else ""
-            if "default_val" in val and val["default_val"] in val:
-                _default = val[val["default_val"]]
-
-            if _name not in data:
-                data[_name] = from_entry([], _source, default=_default)
-
-        elif _type == "bool":
-            _default = val["default"] if "default" in val else False
-            _reverse = val["reverse"] if "reverse" in val else False
-            if _name not in data:
-                data[_name] = from_entry_bool(
-                    [], _source, default=_default, reverse=_reverse
-                )
+    for _name, accessor, _ in compile_vals(vals):
+        if _name not in data:
+            data[_name] = accessor([])
 
     return data
 
@@ -273,47 +485,16 @@ def fill_defaults(data, vals) -> dict:
 # ---------------------------
 def fill_vals(data, entry, uid, vals) -> dict:
     """Fill all data"""
-    for val in vals:
-        _name = val["name"]
-        _type = val["type"] if "type" in val else "str"
-        _source = val["source"] if "source" in val else _name
-        _convert = val["convert"] if "convert" in val else None
-
-        if _type == "str":
-            _default = val["default"] if "default" in val else ""
-            if "default_val" in val and val["default_val"] in val:
-                _default = val[val["default_val"]]
-
-            if uid:
-                data[uid][_name] = from_entry(entry, _source, default=_default)
-            else:
-                data[_name] = from_entry(entry, _source, default=_default)
-
-        elif _type == "bool":
-            _default = val["default"] if "default" in val else False
-            _reverse = val["reverse"] if "reverse" in val else False
-
-            if uid:
-                data[uid][_name] = from_entry_bool(
-                    entry, _source, default=_default, reverse=_reverse
-                )
-            else:
-                data[_name] = from_entry_bool(
-                    entry, _source, default=_default, reverse=_reverse
-                )
-
-        if _convert == "utc_from_timestamp":
-            if uid:
-                if isinstance(data[uid][_name], int) and data[uid][_name] > 0:
-                    if data[uid][_name] > 100000000000:
-                        data[uid][_name] = data[uid][_name] / 1000
+    _data = data[uid] if uid else data
+    for _name, accessor, utc_convert in compile_vals(vals):
+        value = accessor(entry)
+        if utc_convert and isinstance(value, int) and value > 0:
+            if value > 100000000000:
+                value = value / 1000
 
-                    data[uid][_name] = utc_from_timestamp(data[uid][_name])
-            elif isinstance(data[_name], int) and data[_name] > 0:
-                if data[_name] > 100000000000:
-                    data[_name] = data[_name] / 1000
+            value = utc_from_timestamp(value)
 
-                data[_name] = utc_from_timestamp(data[_name])
+        _data[_name] = value
 
     return data
 
@@ -323,15 +504,10 @@ def fill_vals(data, entry, uid, vals) -> dict:
 # ---------------------------
 def fill_ensure_vals(data, uid, ensure_vals) -> dict:
     """Add required keys which are not available in data"""
-    for val in ensure_vals:
-        if uid:
-            if val["name"] not in data[uid]:
-                _default = val["default"] if "default" in val else ""
-                data[uid][val["name"]] = _default
-
-        elif val["name"] not in data:
-            _default = val["default"] if "default" in val else ""
-            data[val["name"]] = _default
+    _data = data[uid] if uid else data
+    for _name, _default in compile_ensure_vals(ensure_vals):
+        if _name not in _data:
+            _data[_name] = _default
 
     return data
 
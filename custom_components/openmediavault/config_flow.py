@@ -26,10 +26,35 @@ from .const import (
     DEFAULT_SSL_VERIFY,
     DEFAULT_USERNAME,
     DOMAIN,
-    CONF_SCAN_INTERVAL,
-    DEFAULT_SCAN_INTERVAL,
     CONF_SMART_DISABLE,
     DEFAULT_SMART_DISABLE,
+    CONF_SMART_SKIP_STANDBY,
+    DEFAULT_SMART_SKIP_STANDBY,
+    CONF_SMART_INTERVAL,
+    DEFAULT_SMART_INTERVAL,
+    CONF_UPDATE_CONCURRENCY,
+    DEFAULT_UPDATE_CONCURRENCY,
+    CONF_POOL_SIZE,
+    DEFAULT_POOL_SIZE,
+    CONF_KEEPALIVE_TIMEOUT,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    CONF_CONNECT_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    CONF_SESSION_LIFETIME,
+    DEFAULT_SESSION_LIFETIME,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    CONF_SCAN_INTERVAL_MIN,
+    DEFAULT_SCAN_INTERVAL_MIN,
+    CONF_SCAN_INTERVAL_MAX,
+    DEFAULT_SCAN_INTERVAL_MAX,
+    CONF_PAGE_SIZE,
+    DEFAULT_PAGE_SIZE,
+    CONF_PROFILE_POLLING,
+    DEFAULT_PROFILE_POLLING,
+    UPDATE_TIERS,
 )
 from .omv_api import OpenMediaVaultAPI
 
@@ -76,8 +101,7 @@ class OMVConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors["base"] = "name_exists"
 
             # Test connection
-            api = await self.hass.async_add_executor_job(
-                OpenMediaVaultAPI,
+            api = OpenMediaVaultAPI(
                 self.hass,
                 user_input[CONF_HOST],
                 user_input[CONF_USERNAME],
@@ -86,10 +110,12 @@ class OMVConfigFlow(ConfigFlow, domain=DOMAIN):
                 user_input[CONF_VERIFY_SSL],
             )
 
-            if not await self.hass.async_add_executor_job(api.connect):
+            if not await api.async_connect():
                 _LOGGER.error("OpenMediaVault %s connect error", api.error)
                 errors[CONF_HOST] = api.error
 
+            await api.async_close()
+
             # Save instance
             if not errors:
                 return self.async_create_entry(
@@ -151,23 +177,104 @@ class OMVOptionsFlowHandler(OptionsFlow):
             self.options.update(user_input)
             return self.async_create_entry(title="", data=self.options)
 
+        scan_intervals = {
+            vol.Optional(
+                conf_interval,
+                default=self.config_entry.options.get(conf_interval, default_interval),
+            ): vol.All(vol.Coerce(int), vol.Range(min=5))
+            for conf_interval, default_interval in UPDATE_TIERS.values()
+        }
+
         return self.async_show_form(
             step_id="basic_options",
             last_step=True,
             data_schema=vol.Schema(
                 {
+                    **scan_intervals,
+                    vol.Optional(
+                        CONF_ADAPTIVE_POLLING,
+                        default=self.config_entry.options.get(
+                            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                        ),
+                    ): bool,
                     vol.Optional(
-                        CONF_SCAN_INTERVAL,
+                        CONF_SCAN_INTERVAL_MIN,
                         default=self.config_entry.options.get(
-                            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                            CONF_SCAN_INTERVAL_MIN, DEFAULT_SCAN_INTERVAL_MIN
                         ),
-                    ): int,
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_MAX,
+                        default=self.config_entry.options.get(
+                            CONF_SCAN_INTERVAL_MAX, DEFAULT_SCAN_INTERVAL_MAX
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5)),
                     vol.Optional(
                         CONF_SMART_DISABLE,
                         default=self.config_entry.options.get(
                             CONF_SMART_DISABLE, DEFAULT_SMART_DISABLE
                         ),
                     ): bool,
+                    vol.Optional(
+                        CONF_SMART_SKIP_STANDBY,
+                        default=self.config_entry.options.get(
+                            CONF_SMART_SKIP_STANDBY, DEFAULT_SMART_SKIP_STANDBY
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_SMART_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_SMART_INTERVAL, DEFAULT_SMART_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=60)),
+                    vol.Optional(
+                        CONF_UPDATE_CONCURRENCY,
+                        default=self.config_entry.options.get(
+                            CONF_UPDATE_CONCURRENCY, DEFAULT_UPDATE_CONCURRENCY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                    vol.Optional(
+                        CONF_PAGE_SIZE,
+                        default=self.config_entry.options.get(
+                            CONF_PAGE_SIZE, DEFAULT_PAGE_SIZE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=1000)),
+                    vol.Optional(
+                        CONF_POOL_SIZE,
+                        default=self.config_entry.options.get(
+                            CONF_POOL_SIZE, DEFAULT_POOL_SIZE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                    vol.Optional(
+                        CONF_KEEPALIVE_TIMEOUT,
+                        default=self.config_entry.options.get(
+                            CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+                    vol.Optional(
+                        CONF_CONNECT_TIMEOUT,
+                        default=self.config_entry.options.get(
+                            CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+                    vol.Optional(
+                        CONF_READ_TIMEOUT,
+                        default=self.config_entry.options.get(
+                            CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=600)),
+                    vol.Optional(
+                        CONF_SESSION_LIFETIME,
+                        default=self.config_entry.options.get(
+                            CONF_SESSION_LIFETIME, DEFAULT_SESSION_LIFETIME
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Optional(
+                        CONF_PROFILE_POLLING,
+                        default=self.config_entry.options.get(
+                            CONF_PROFILE_POLLING, DEFAULT_PROFILE_POLLING
+                        ),
+                    ): bool,
                 }
             ),
         )
@@ -1,5 +1,8 @@
 """Constants used by the OpenMediaVault integration."""
+import voluptuous as vol
+
 from homeassistant.const import Platform
+import homeassistant.helpers.config_validation as cv
 
 PLATFORMS = [
     Platform.SENSOR,
@@ -19,8 +22,56 @@ DEFAULT_SSL_VERIFY = True
 
 CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_SCAN_INTERVAL = 60
+CONF_SCAN_INTERVAL_FS = "scan_interval_fs"
+DEFAULT_SCAN_INTERVAL_FS = 300
+CONF_SCAN_INTERVAL_DISK = "scan_interval_disk"
+DEFAULT_SCAN_INTERVAL_DISK = 600
+CONF_SCAN_INTERVAL_NETWORK = "scan_interval_network"
+DEFAULT_SCAN_INTERVAL_NETWORK = 60
+CONF_SCAN_INTERVAL_SERVICE = "scan_interval_service"
+DEFAULT_SCAN_INTERVAL_SERVICE = 300
+CONF_SCAN_INTERVAL_KVM = "scan_interval_kvm"
+DEFAULT_SCAN_INTERVAL_KVM = 60
+CONF_SCAN_INTERVAL_COMPOSE = "scan_interval_compose"
+DEFAULT_SCAN_INTERVAL_COMPOSE = 60
+
+UPDATE_TIERS = {
+    "hwinfo": (CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+    "fs": (CONF_SCAN_INTERVAL_FS, DEFAULT_SCAN_INTERVAL_FS),
+    "disk": (CONF_SCAN_INTERVAL_DISK, DEFAULT_SCAN_INTERVAL_DISK),
+    "network": (CONF_SCAN_INTERVAL_NETWORK, DEFAULT_SCAN_INTERVAL_NETWORK),
+    "service": (CONF_SCAN_INTERVAL_SERVICE, DEFAULT_SCAN_INTERVAL_SERVICE),
+    "kvm": (CONF_SCAN_INTERVAL_KVM, DEFAULT_SCAN_INTERVAL_KVM),
+    "compose": (CONF_SCAN_INTERVAL_COMPOSE, DEFAULT_SCAN_INTERVAL_COMPOSE),
+}
 CONF_SMART_DISABLE = "smart_disable"
 DEFAULT_SMART_DISABLE = False
+CONF_SMART_SKIP_STANDBY = "smart_skip_standby"
+DEFAULT_SMART_SKIP_STANDBY = False
+CONF_SMART_INTERVAL = "smart_interval"
+DEFAULT_SMART_INTERVAL = 3600
+CONF_UPDATE_CONCURRENCY = "update_concurrency"
+DEFAULT_UPDATE_CONCURRENCY = 4
+CONF_POOL_SIZE = "pool_size"
+DEFAULT_POOL_SIZE = 4
+CONF_KEEPALIVE_TIMEOUT = "keepalive_timeout"
+DEFAULT_KEEPALIVE_TIMEOUT = 55
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+DEFAULT_CONNECT_TIMEOUT = 10
+CONF_READ_TIMEOUT = "read_timeout"
+DEFAULT_READ_TIMEOUT = 30
+CONF_SESSION_LIFETIME = "session_lifetime"
+DEFAULT_SESSION_LIFETIME = 0
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = False
+CONF_SCAN_INTERVAL_MIN = "scan_interval_min"
+DEFAULT_SCAN_INTERVAL_MIN = 10
+CONF_SCAN_INTERVAL_MAX = "scan_interval_max"
+DEFAULT_SCAN_INTERVAL_MAX = 900
+CONF_PAGE_SIZE = "page_size"
+DEFAULT_PAGE_SIZE = 100
+CONF_PROFILE_POLLING = "profile_polling"
+DEFAULT_PROFILE_POLLING = False
 
 TO_REDACT = {
     "username",
@@ -42,3 +93,21 @@ SERVICE_KVM_RESTART = "kvm_restart"
 SCHEMA_SERVICE_KVM_RESTART = {}
 SERVICE_KVM_SNAPSHOT = "kvm_snapshot"
 SCHEMA_SERVICE_KVM_SNAPSHOT = {}
+
+# Kvm.doCommand commands and the VM state they require
+KVM_COMMANDS = {
+    "poweron": "shutoff",
+    "poweroff": "running",
+    "reboot": "running",
+}
+# VM state expected once a Kvm.doCommand command succeeded
+KVM_COMMAND_STATES = {
+    "poweron": "running",
+    "poweroff": "shutoff",
+    "reboot": "running",
+}
+SERVICE_KVM_COMMAND = "kvm_command"
+SCHEMA_SERVICE_KVM_COMMAND = {
+    vol.Required("command"): vol.In(list(KVM_COMMANDS)),
+    vol.Optional("refresh", default=False): cv.boolean,
+}
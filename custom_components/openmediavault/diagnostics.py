@@ -26,5 +26,11 @@ async def async_get_config_entry_diagnostics(
     diag["entry"]["data"] = async_redact_data(config_entry.data, TO_REDACT)
     diag["entry"]["options"] = async_redact_data(config_entry.options, TO_REDACT)
     diag["data"] = async_redact_data(controller.data, TO_REDACT)
+    diag["connection"] = dict(controller.api.connection_stats)
+    diag["connection"]["session_lifetime"] = controller.api.session_lifetime
+    diag["connection"]["circuit"] = controller.api.breaker.state
+    diag["query_slots"] = dict(controller.api.query_slots.stats)
+    diag["rpc"] = controller.api.rpc_statistics()
+    diag["profile"] = list(controller.profiles)
 
     return diag
@@ -1,4 +1,17 @@
 """Helper functions for OMV."""
+from contextvars import ContextVar
+from functools import wraps
+from logging import DEBUG, getLogger
+from time import monotonic, time
+
+from homeassistant.components.diagnostics import async_redact_data
+
+TRACE_LOGGER = f"{__package__}.trace"
+TRACE_RATE = 10
+TRACE_BURST = 50
+
+PROFILE_PHASES = ("lock_wait", "queue", "network", "decode", "parse", "dispatch")
+_PROFILE = ContextVar(f"{__package__}.profile", default=None)
 
 
 # ---------------------------
@@ -21,3 +34,138 @@ def format_value(res):
     res = res.replace("wireless", "Wireless")
     res = res.replace("restored", "Restored")
     return res
+
+
+# ---------------------------
+#   LazyRedact
+# ---------------------------
+class LazyRedact:
+    """Log argument redacting data only when the record is formatted."""
+
+    __slots__ = ("_data", "_to_redact")
+
+    def __init__(self, data, to_redact):
+        self._data = data
+        self._to_redact = to_redact
+
+    def __str__(self):
+        return str(async_redact_data(self._data, self._to_redact))
+
+    __repr__ = __str__
+
+
+# ---------------------------
+#   DebugTrace
+# ---------------------------
+class DebugTrace:
+    """Rate limited debug logging for one category.
+
+    Each category logs to its own child logger, so it can be toggled
+    separately, e.g. custom_components.openmediavault.trace.parser.
+    Records over TRACE_RATE per second (with TRACE_BURST headroom) are
+    dropped and reported as a count with the next emitted record.
+    """
+
+    def __init__(self, category, rate=TRACE_RATE, burst=TRACE_BURST):
+        self.logger = getLogger(f"{TRACE_LOGGER}.{category}")
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._last = monotonic()
+        self.suppressed = 0
+
+    def enabled(self) -> bool:
+        """Return True if debug logging is enabled for this category."""
+        return self.logger.isEnabledFor(DEBUG)
+
+    def __call__(self, msg, *args):
+        """Log a debug record unless disabled or over the rate limit."""
+        if not self.logger.isEnabledFor(DEBUG):
+            return
+
+        now = monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+        if self._tokens < 1:
+            self.suppressed += 1
+            return
+
+        self._tokens -= 1
+        if self.suppressed:
+            self.logger.debug("%s records suppressed", self.suppressed)
+            self.suppressed = 0
+
+        self.logger.debug(msg, *args)
+
+
+# ---------------------------
+#   CycleProfile
+# ---------------------------
+class CycleProfile:
+    """Phase timings of one poll cycle.
+
+    The profile is set as context variable while the cycle runs, so the
+    API and parser add their time to it from every task the cycle spawns.
+    Phases of concurrent tasks overlap and may sum up over the duration.
+    """
+
+    __slots__ = ("cycle", "skipped", "phases", "_started", "_start", "_token")
+
+    def __init__(self, cycle):
+        self.cycle = cycle
+        self.skipped = False
+        self.phases = dict.fromkeys(PROFILE_PHASES, 0.0)
+        self._started = time()
+        self._start = monotonic()
+        self._token = _PROFILE.set(self)
+
+    def finish(self) -> dict:
+        """Stop profiling and return the cycle summary."""
+        _PROFILE.reset(self._token)
+        return {
+            "cycle": self.cycle,
+            "started": round(self._started, 3),
+            "duration": round(monotonic() - self._start, 4),
+            "skipped": self.skipped,
+            **{phase: round(value, 4) for phase, value in self.phases.items()},
+        }
+
+
+# ---------------------------
+#   profile_current
+# ---------------------------
+def profile_current() -> CycleProfile | None:
+    """Return profile of the running poll cycle, None when not profiling."""
+    return _PROFILE.get()
+
+
+# ---------------------------
+#   profile_add
+# ---------------------------
+def profile_add(phase, start) -> None:
+    """Add time since start to a phase of the running poll cycle."""
+    if (profile := _PROFILE.get()) is not None:
+        profile.phases[phase] += monotonic() - start
+
+
+# ---------------------------
+#   profiled
+# ---------------------------
+def profiled(phase):
+    """Decorator adding time spent in a function to a poll cycle phase."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _PROFILE.get() is None:
+                return func(*args, **kwargs)
+
+            start = monotonic()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile_add(phase, start)
+
+        return wrapper
+
+    return decorator
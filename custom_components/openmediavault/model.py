@@ -9,6 +9,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME, CONF_HOST
+from .apiparser import MISSING_FLAG
 from .helper import format_attribute
 from .const import DOMAIN, ATTRIBUTION
 from .omv_controller import OMVControllerData
@@ -36,8 +37,11 @@ async def model_async_setup_entry(
         platform.async_register_entity_service(tmp[0], tmp[1], tmp[2])
 
     @callback
-    def update_controller():
+    def update_controller(changes=None, added=None, removed=None):
         """Update the values of the controller"""
+        if removed:
+            model_remove_items(hass, sensors, removed)
+
         model_update_items(
             inst,
             omv_controller,
@@ -45,6 +49,8 @@ async def model_async_setup_entry(
             sensors,
             sensor_types,
             dispatcher,
+            changes,
+            added,
         )
 
     omv_controller.listeners.append(
@@ -63,11 +69,15 @@ def model_update_items(
     sensors,
     sensor_types,
     dispatcher,
+    changes=None,
+    added=None,
 ):
     def _register_entity(_sensors, _item_id, _uid, _uid_sensor):
-        _LOGGER.debug("Updating entity %s", _item_id)
         if _item_id in _sensors:
-            if _sensors[_item_id].enabled:
+            if _sensors[_item_id].enabled and (
+                changes is None or _uid in changes.get(_uid_sensor.data_path, ())
+            ):
+                _LOGGER.debug("Updating entity %s", _item_id)
                 _sensors[_item_id].async_schedule_update_ha_state()
             return None
 
@@ -107,8 +117,14 @@ def model_update_items(
                 sensors[item_id] = tmp
                 new_sensors.append(sensors[item_id])
         else:
-            for uid in omv_controller.data[uid_sensor.data_path]:
-                uid_data = omv_controller.data[uid_sensor.data_path]
+            uid_data = omv_controller.data[uid_sensor.data_path]
+            uids = uid_data
+            if changes is not None and added is not None:
+                uids = changes.get(uid_sensor.data_path, set()) | added.get(
+                    uid_sensor.data_path, set()
+                )
+
+            for uid in uids:
                 item_id = f"{inst}-{sensor}-{str(uid_data[uid][uid_sensor.data_reference]).lower()}"
                 if tmp := _register_entity(sensors, item_id, uid, uid_sensor):
                     sensors[item_id] = tmp
@@ -118,6 +134,28 @@ def model_update_items(
         async_add_entities(new_sensors, True)
 
 
+# ---------------------------
+#   model_remove_items
+# ---------------------------
+@callback
+def model_remove_items(hass: HomeAssistant, sensors, removed):
+    """Remove entities whose uid vanished from the controller data
+
+    Registry entries are kept, so user customizations survive an item that
+    returns, e.g. a disk that was detached for a while.
+    """
+    for item_id, entity in list(sensors.items()):
+        if not entity._uid or entity._uid not in removed.get(
+            entity.entity_description.data_path, ()
+        ):
+            continue
+
+        _LOGGER.debug("Removing entity %s", item_id)
+        sensors.pop(item_id)
+        if entity.hass:
+            hass.async_create_task(entity.async_remove())
+
+
 # ---------------------------
 #   OMVEntity
 # ---------------------------
@@ -167,8 +205,8 @@ class OMVEntity:
 
     @property
     def available(self) -> bool:
-        """Return if controller is available"""
-        return self._ctrl.connected()
+        """Return if controller is available and the item was last seen"""
+        return self._ctrl.connected() and not self._data.get(MISSING_FLAG)
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -244,3 +282,7 @@ class OMVEntity:
     async def snapshot(self):
         """Dummy snapshot function"""
         raise NotImplementedError()
+
+    async def kvm_command(self, command, refresh=False):
+        """Dummy kvm_command function"""
+        raise NotImplementedError()
@@ -1,38 +1,290 @@
 """OpenMediaVault API."""
 
+import asyncio
 import json
 import logging
-from os import path
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from os import path, remove
+from random import uniform
+from statistics import median
 from typing import Any
-from pickle import dump as pickle_dump
-from pickle import load as pickle_load
-from threading import Lock
-from time import time
+from time import monotonic
 
-import requests
+from aiohttp import (
+    ClientError,
+    ClientSession,
+    ClientTimeout,
+    CookieJar,
+    TCPConnector,
+    TraceConfig,
+)
 from voluptuous import Optional
+from yarl import URL
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util import ssl as ssl_util
+
+from .const import DOMAIN, TO_REDACT
+from .helper import DebugTrace, LazyRedact, profile_add
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 _LOGGER = logging.getLogger(__name__)
+_TRACE = DebugTrace("query")
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+DATA_SESSION_STORE = f"{DOMAIN}_session_store"
+STORAGE_KEY = f"{DOMAIN}.sessions"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+LEGACY_COOKIE_FILE = ".omv_cookies.json"
+
+# Upper bounds in seconds of the RPC latency histogram buckets, last is open
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Consecutive query timeouts after which the host is considered unreachable
+TIMEOUT_DISCONNECT = 3
+
+# Session renewal: share of the session lifetime after which it is renewed,
+# number of observed expiries the lifetime is learned from, expiries needed
+# before renewing, lower bound and every how many learned sessions one is
+# left to expire to keep learning
+SESSION_RENEW_AT = 0.8
+SESSION_LIFETIME_SAMPLES = 5
+SESSION_LIFETIME_MIN_SAMPLES = 3
+SESSION_LIFETIME_MIN = 60
+SESSION_RELEARN_EVERY = 5
+
+# Queries waiting for a query slot before further ones are rejected
+QUERY_QUEUE_LIMIT = 256
+
+# Circuit breaker: reconnect backoff bounds in seconds and jitter fraction
+BREAKER_BACKOFF_MIN = 10
+BREAKER_BACKOFF_MAX = 600
+BREAKER_JITTER = 0.2
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+_DEADLINE = ContextVar(f"{DOMAIN}_rpc_deadline", default=None)
+
+
+# ---------------------------
+#   JSON codec
+# ---------------------------
+if orjson:
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+else:
+
+    def json_dumps(data) -> bytes:
+        """Encode data to compact JSON bytes."""
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    json_loads = json.loads
+
+
+# ---------------------------
+#   DeadlineExceeded
+# ---------------------------
+class DeadlineExceeded(Exception):
+    """RPC deadline of the running cycle has passed."""
+
+
+# ---------------------------
+#   rpc_deadline
+# ---------------------------
+@contextmanager
+def rpc_deadline(seconds):
+    """Require all RPCs made in this context to finish within seconds.
+
+    Tasks spawned in the context inherit the deadline, nested deadlines
+    can only shorten it.
+    """
+    deadline = monotonic() + seconds
+    if (current := _DEADLINE.get()) is not None:
+        deadline = min(deadline, current)
+
+    token = _DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+# ---------------------------
+#   deadline_passed
+# ---------------------------
+def deadline_passed() -> bool:
+    """Return True if the RPC deadline of this context has passed."""
+    return (deadline := _DEADLINE.get()) is not None and monotonic() >= deadline
 
 
 # ---------------------------
-#   load_cookies
+#   remove_legacy_cookies
 # ---------------------------
-def load_cookies(filename: str) -> Optional(dict):
-    """Load cookies from file."""
+def remove_legacy_cookies(filename: str):
+    """Remove cookie file written by previous versions."""
     if path.isfile(filename):
-        with open(filename, "rb") as f:
-            return pickle_load(f)
-    return None
+        remove(filename)
 
 
 # ---------------------------
-#   save_cookies
+#   OMVSessionStore
 # ---------------------------
-def save_cookies(filename: str, data: dict):
-    """Save cookies to file."""
-    with open(filename, "wb") as f:
-        pickle_dump(data, f)
+class OMVSessionStore(object):
+    """Session cookies of all OMV hosts, kept in memory and saved via HA storage."""
+
+    def __init__(self, hass):
+        """Initialize the session store."""
+        self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY, private=True)
+        self._lock = asyncio.Lock()
+        self._data = None
+
+    async def async_get(self, host) -> dict:
+        """Return stored cookies for host."""
+        if self._data is None:
+            async with self._lock:
+                if self._data is None:
+                    self._data = await self._store.async_load() or {}
+                    await self._hass.async_add_executor_job(
+                        remove_legacy_cookies,
+                        self._hass.config.path(LEGACY_COOKIE_FILE),
+                    )
+
+        return self._data.get(host, {})
+
+    @callback
+    def async_set(self, host, cookies) -> None:
+        """Store cookies for host, schedule a save if they changed."""
+        if self._data is None or self._data.get(host) == cookies:
+            return
+
+        self._data[host] = cookies
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+
+# ---------------------------
+#   async_get_session_store
+# ---------------------------
+@callback
+def async_get_session_store(hass) -> OMVSessionStore:
+    """Return the session store shared by all OMV hosts."""
+    if DATA_SESSION_STORE not in hass.data:
+        hass.data[DATA_SESSION_STORE] = OMVSessionStore(hass)
+
+    return hass.data[DATA_SESSION_STORE]
+
+
+# ---------------------------
+#   QuerySlots
+# ---------------------------
+class QuerySlots(object):
+    """Bounded pool of concurrent query slots for one host.
+
+    At most size queries are in flight, up to queue_limit more wait for
+    a slot. A slow or hung host only queues its own queries.
+    """
+
+    def __init__(self, size, queue_limit=QUERY_QUEUE_LIMIT):
+        """Initialize query slots."""
+        self._semaphore = asyncio.Semaphore(size)
+        self._queue_limit = queue_limit
+        self.stats = {
+            "size": size,
+            "active": 0,
+            "waiting": 0,
+            "max_waiting": 0,
+            "rejected": 0,
+            "wait_time": 0.0,
+        }
+
+    def full(self) -> bool:
+        """Return True and count the rejection if the wait queue is full."""
+        if self._semaphore.locked() and self.stats["waiting"] >= self._queue_limit:
+            self.stats["rejected"] += 1
+            return True
+
+        return False
+
+    async def __aenter__(self):
+        """Wait for a free slot."""
+        self.stats["waiting"] += 1
+        self.stats["max_waiting"] = max(
+            self.stats["max_waiting"], self.stats["waiting"]
+        )
+        start = monotonic()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.stats["waiting"] -= 1
+            self.stats["wait_time"] += monotonic() - start
+
+        self.stats["active"] += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Release the slot."""
+        self.stats["active"] -= 1
+        self._semaphore.release()
+
+
+# ---------------------------
+#   CircuitBreaker
+# ---------------------------
+class CircuitBreaker(object):
+    """Connection state of one host with exponential reconnect backoff.
+
+    Closed while the host answers. A failure opens the circuit and no
+    connection is attempted until the backoff expires, then a single
+    half-open attempt either closes it or opens it with doubled backoff.
+    """
+
+    def __init__(
+        self,
+        backoff_min=BREAKER_BACKOFF_MIN,
+        backoff_max=BREAKER_BACKOFF_MAX,
+        jitter=BREAKER_JITTER,
+    ):
+        """Initialize the circuit breaker."""
+        self._backoff_min = backoff_min
+        self._backoff_max = backoff_max
+        self._jitter = jitter
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.retry_at = 0.0
+
+    def is_open(self) -> bool:
+        """Return True while connection attempts are held back."""
+        return self.state == STATE_OPEN and monotonic() < self.retry_at
+
+    def half_open(self) -> None:
+        """Mark a connection attempt after the backoff expired."""
+        self.state = STATE_HALF_OPEN
+
+    def success(self) -> None:
+        """Close the circuit."""
+        self.state = STATE_CLOSED
+        self.failures = 0
+
+    def failure(self) -> float:
+        """Open the circuit, return the backoff in seconds."""
+        self.failures += 1
+        backoff = min(
+            self._backoff_max, self._backoff_min * 2 ** (self.failures - 1)
+        ) * (1 + uniform(-self._jitter, self._jitter))
+        self.state = STATE_OPEN
+        self.retry_at = monotonic() + backoff
+        return backoff
 
 
 # ---------------------------
@@ -41,7 +293,21 @@ def save_cookies(filename: str, data: dict):
 class OpenMediaVaultAPI(object):
     """Handle all communication with OMV."""
 
-    def __init__(self, hass, host, username, password, use_ssl=False, verify_ssl=True):
+    def __init__(
+        self,
+        hass,
+        host,
+        username,
+        password,
+        use_ssl=False,
+        verify_ssl=True,
+        max_concurrent=1,
+        pool_size=4,
+        keepalive_timeout=55,
+        connect_timeout=10,
+        read_timeout=30,
+        session_lifetime=0,
+    ):
         """Initialize the OMV API."""
         self._hass = hass
         self._host = host
@@ -54,15 +320,39 @@ class OpenMediaVaultAPI(object):
             self._ssl_verify = True
         self._resource = f"{self._protocol}://{self._host}/rpc.php"
 
-        self.lock = Lock()
+        self.lock = asyncio.Lock()
+        self.query_slots = QuerySlots(max_concurrent)
+
+        self._pool_size = pool_size
+        self._keepalive_timeout = keepalive_timeout
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._timeouts_in_row = 0
+        self.connection_stats = {
+            "created": 0,
+            "reused": 0,
+            "logins": 0,
+            "relogins": 0,
+            "replayed": 0,
+            "renewals": 0,
+            "timeouts": 0,
+            "circuit_opened": 0,
+            "deadline_missed": 0,
+        }
+        self.rpc_stats = {}
 
         self._connection = None
-        self._cookie_jar = None
-        self._cookie_jar_file = self._hass.config.path(".omv_cookies.json")
+        self._session_store = async_get_session_store(hass)
+        self._session_generation = 0
+        self._session_started = None
+        self._session_lifetime = session_lifetime
+        self._session_expiries = deque(maxlen=SESSION_LIFETIME_SAMPLES)
+        self._session_renewals = 0
+        self._renew_callback = None
+        self._relogin = None
         self._connected = False
         self._reconnected = False
-        self._connection_epoch = 0
-        self._connection_retry_sec = 58
+        self.breaker = CircuitBreaker()
         self.error = None
         self.connection_error_reported = False
         self.accounting_last_run = None
@@ -79,18 +369,95 @@ class OpenMediaVaultAPI(object):
         return False
 
     # ---------------------------
-    #   connection_check
+    #   async_connection_check
     # ---------------------------
-    def connection_check(self) -> bool:
-        """Check if API is connected."""
-        if not self._connected or not self._connection:
-            if self._connection_epoch > time() - self._connection_retry_sec:
-                return False
+    async def async_connection_check(self) -> bool:
+        """Check if API is connected, reconnect unless the circuit is open."""
+        if self._connected and self._connection:
+            return True
+
+        if self.breaker.is_open():
+            return False
 
-            if not self.connect():
+        async with self.lock:
+            # Another query may have reconnected while we were waiting
+            if self._connected and self._connection:
+                return True
+
+            if self.breaker.is_open():
                 return False
 
-        return True
+            if self.breaker.state == STATE_OPEN:
+                self.breaker.half_open()
+                probe = await self._async_probe()
+                if probe is None:
+                    return self._login_result(False)
+
+                if probe:
+                    _LOGGER.warning("OpenMediaVault %s reconnected", self._host)
+                    self.connection_error_reported = False
+                    self._connected = True
+                    self._reconnected = True
+                    return self._login_result(True)
+
+            return self._login_result(await self._async_login())
+
+    # ---------------------------
+    #   circuit_open
+    # ---------------------------
+    def circuit_open(self) -> bool:
+        """Return True while the host is considered down and not retried."""
+        return not self._connected and self.breaker.is_open()
+
+    # ---------------------------
+    #   _login_result
+    # ---------------------------
+    def _login_result(self, connected) -> bool:
+        """Close the circuit after a connection attempt or open it again."""
+        if connected:
+            self.breaker.success()
+            return True
+
+        self._open_circuit()
+        return False
+
+    def _open_circuit(self) -> None:
+        """Open the circuit after a failure."""
+        self.connection_stats["circuit_opened"] += 1
+        backoff = self.breaker.failure()
+        _LOGGER.debug(
+            "OpenMediaVault %s unavailable, retrying in %.0fs", self._host, backoff
+        )
+
+    # ---------------------------
+    #   _async_probe
+    # ---------------------------
+    async def _async_probe(self):
+        """Check with a cheap RPC whether the host answers again.
+
+        Return None if unreachable, True if the session is still valid,
+        False if a login is needed.
+        """
+        if not self._connection:
+            return False
+
+        try:
+            async with self._connection.post(
+                self._resource,
+                data=json_dumps(
+                    {"service": "System", "method": "noop", "params": None}
+                ),
+                headers=JSON_HEADERS,
+                timeout=self._request_timeout(deadline=False),
+            ) as response:
+                if response.status != 200:
+                    return None
+
+                data = json_loads(await response.read())
+        except Exception:
+            return None
+
+        return data.get("error") is None
 
     # ---------------------------
     #   disconnect
@@ -110,48 +477,243 @@ class OpenMediaVaultAPI(object):
 
             self.connection_error_reported = True
 
+        if self._connected:
+            self._open_circuit()
+
         self._reconnected = False
         self._connected = False
-        self._connection = None
-        self._connection_epoch = 0
 
     # ---------------------------
     #   connect
     # ---------------------------
     def connect(self) -> bool:
+        """Connect API from a worker thread."""
+        return self._run_threadsafe(self.async_connect())
+
+    # ---------------------------
+    #   async_connect
+    # ---------------------------
+    async def async_connect(self) -> bool:
         """Connect API."""
+        async with self.lock:
+            return self._login_result(await self._async_login())
+
+    # ---------------------------
+    #   _async_refresh_session
+    # ---------------------------
+    async def _async_refresh_session(self, session) -> bool:
+        """Log in again after the session expired, once for all waiting queries.
+
+        Queries seeing the expiry of the same session share one login and
+        are replayed when it completes. Queries sent with a session that
+        was already replaced are replayed right away.
+        """
+        if session != self._session_generation:
+            return self._connected
+
+        if self._relogin is None:
+            self.connection_stats["relogins"] += 1
+            if self._session_started is not None:
+                self._session_expiries.append(monotonic() - self._session_started)
+
+        return await self._async_shared_login()
+
+    async def _async_shared_login(self) -> bool:
+        """Start a login unless one is in flight and wait for it."""
+        if self._relogin is None:
+            self._relogin = self._hass.async_create_task(self._async_relogin())
+
+        return await asyncio.shield(self._relogin)
+
+    async def _async_relogin(self) -> bool:
+        """Run the shared login."""
+        try:
+            return await self.async_connect()
+        finally:
+            self._relogin = None
+
+    # ---------------------------
+    #   session_lifetime
+    # ---------------------------
+    @property
+    def session_lifetime(self) -> float | None:
+        """Return configured session lifetime, else the one learned from expiries.
+
+        An expiry is noticed by the first query after it, so the observed
+        session age is an upper bound. The median ignores sessions ended
+        early, e.g. by an OMV restart.
+        """
+        if self._session_lifetime:
+            return self._session_lifetime
+
+        if len(self._session_expiries) < SESSION_LIFETIME_MIN_SAMPLES:
+            return None
+
+        return max(SESSION_LIFETIME_MIN, median(self._session_expiries))
+
+    # ---------------------------
+    #   _schedule_renewal
+    # ---------------------------
+    @callback
+    def _schedule_renewal(self):
+        """Schedule renewal of the current session shortly before it expires."""
+        if self._renew_callback:
+            self._renew_callback()
+            self._renew_callback = None
+
+        if lifetime := self.session_lifetime:
+            self._renew_callback = async_call_later(
+                self._hass, lifetime * SESSION_RENEW_AT, self._async_renew_session
+            )
+
+    async def _async_renew_session(self, _now=None):
+        """Renew the session in the background, off the polling path.
+
+        With a learned lifetime every few sessions are left to expire, so
+        the lifetime keeps following the host.
+        """
+        self._renew_callback = None
+        if not self._connected or self._relogin is not None:
+            return
+
+        if not self._session_lifetime:
+            self._session_renewals += 1
+            if self._session_renewals % SESSION_RELEARN_EVERY == 0:
+                _LOGGER.debug("OpenMediaVault %s leaving session to expire", self._host)
+                return
+
+        _LOGGER.debug("OpenMediaVault %s renewing session", self._host)
+        self.connection_stats["renewals"] += 1
+        self._relogin = self._hass.async_create_task(self._async_swap_session())
+        await asyncio.shield(self._relogin)
+
+    async def _async_swap_session(self) -> bool:
+        """Log in on a separate cookie jar, swap the session once it succeeds.
+
+        Queries keep using the current session meanwhile and a failed
+        renewal leaves it in place until it expires.
+        """
+        try:
+            return await self._async_renew_login()
+        finally:
+            self._relogin = None
+
+    async def _async_renew_login(self) -> bool:
+        """Log in with a new session sharing the pooled sockets."""
+        cookie_jar = CookieJar(unsafe=True)
+        authenticated = False
+        timed_out = False
+        size = 0
+        start = monotonic()
+        try:
+            async with ClientSession(
+                connector=self._connection.connector,
+                connector_owner=False,
+                cookie_jar=cookie_jar,
+            ) as session, session.post(
+                self._resource,
+                data=self._login_payload(),
+                headers=JSON_HEADERS,
+                timeout=self._request_timeout(deadline=False),
+            ) as response:
+                body = await response.read()
+                size = len(body)
+                data = json_loads(body)
+
+            authenticated = (
+                response.status == 200
+                and data["error"] is None
+                and data["response"]["authenticated"]
+            )
+        except asyncio.TimeoutError:
+            timed_out = True
+        except Exception as api_error:
+            _LOGGER.debug(
+                "OpenMediaVault %s session renewal failed: %s", self._host, api_error
+            )
+        finally:
+            self._record_rpc(
+                "session.login",
+                monotonic() - start,
+                size,
+                error=not authenticated,
+                timeout=timed_out,
+            )
+
+        if not authenticated or not self._connected:
+            return False
+
+        self._connection.cookie_jar.update_cookies(
+            cookie_jar.filter_cookies(URL(self._resource)), URL(self._resource)
+        )
+        self._session_generation += 1
+        self._session_started = monotonic()
+        self._schedule_renewal()
+        self._store_cookies()
+        return True
+
+    def _login_payload(self) -> bytes:
+        """Return body of the login RPC."""
+        return json_dumps(
+            {
+                "service": "session",
+                "method": "login",
+                "params": {
+                    "username": self._username,
+                    "password": self._password,
+                },
+            }
+        )
+
+    def _store_cookies(self):
+        """Persist cookies of the current session."""
+        self._session_store.async_set(
+            self._host,
+            {
+                cookie.key: cookie.value
+                for cookie in self._connection.cookie_jar.filter_cookies(
+                    URL(self._resource)
+                ).values()
+            },
+        )
+
+    # ---------------------------
+    #   _async_login
+    # ---------------------------
+    async def _async_login(self) -> bool:
+        """Open a new session and log in."""
         self.error = None
         self._connected = False
-        self._connection_epoch = time()
-        self._connection = requests.Session()
-        self._cookie_jar = requests.cookies.RequestsCookieJar()
+        if self._connection:
+            # Keep pooled sockets, only the session cookie is replaced
+            self._connection.cookie_jar.clear()
+        else:
+            self._connection = self._create_session()
 
         # Load cookies
-        if cookies := load_cookies(self._cookie_jar_file):
-            self._connection.cookies.update(cookies)
+        cookies = await self._session_store.async_get(self._host)
+        if cookies:
+            self._connection.cookie_jar.update_cookies(cookies, URL(self._resource))
 
-        self.lock.acquire()
         error = False
+        timed_out = False
+        response = None
+        size = 0
+        start = monotonic()
         try:
-            response = self._connection.post(
+            async with self._connection.post(
                 self._resource,
-                data=json.dumps(
-                    {
-                        "service": "session",
-                        "method": "login",
-                        "params": {
-                            "username": self._username,
-                            "password": self._password,
-                        },
-                    }
-                ),
-                verify=self._ssl_verify,
-            )
+                data=self._login_payload(),
+                headers=JSON_HEADERS,
+                timeout=self._request_timeout(deadline=False),
+            ) as response:
+                if response.status != 200:
+                    error = True
 
-            if response.status_code != 200:
-                error = True
+                body = await response.read()
+                size = len(body)
+                data = json_loads(body)
 
-            data = response.json()
             if data["error"] is not None:
                 if not self.connection_error_reported:
                     _LOGGER.error(
@@ -162,21 +724,20 @@ class OpenMediaVaultAPI(object):
                     self.connection_error_reported = True
 
                 self.error_to_strings("%s" % data["error"]["message"])
-                self._connection = None
-                self.lock.release()
                 return False
 
             if not data["response"]["authenticated"]:
                 _LOGGER.error("OpenMediaVault %s authenticated failed", self._host)
                 self.error_to_strings()
-                self._connection = None
-                self.lock.release()
                 return False
 
-        except requests.exceptions.ConnectionError as api_error:
+        except asyncio.TimeoutError:
+            error = True
+            timed_out = True
+            self.connection_stats["timeouts"] += 1
+        except ClientError as api_error:
             error = True
             self.error_to_strings("%s" % api_error)
-            self._connection = None
         except Exception:
             error = True
         else:
@@ -188,20 +749,26 @@ class OpenMediaVaultAPI(object):
 
             self._connected = True
             self._reconnected = True
-            self.lock.release()
-            for cookie in self._connection.cookies:
-                self._cookie_jar.set_cookie(cookie)
-
-            save_cookies(self._cookie_jar_file, self._cookie_jar)
+            self._session_generation += 1
+            self._session_started = monotonic()
+            self._schedule_renewal()
+            self.connection_stats["logins"] += 1
+            self._store_cookies()
+        finally:
+            self._record_rpc(
+                "session.login",
+                monotonic() - start,
+                size,
+                error=error or not self._connected,
+                timeout=timed_out,
+            )
 
         # Socket errors
         if error:
-            try:
-                errorcode = response.status_code
-            except Exception:
-                errorcode = "no_respose"
-
-            if errorcode == 200:
+            errorcode = response.status if response is not None else "no_respose"
+            if timed_out:
+                errorcode = "timeout"
+            elif errorcode == 200:
                 errorcode = "cannot_connect"
 
             _LOGGER.warning(
@@ -212,10 +779,155 @@ class OpenMediaVaultAPI(object):
             self.error = error_code
             self._connected = False
             self.disconnect("connect")
-            self.lock.release()
 
         return self._connected
 
+    # ---------------------------
+    #   _create_session
+    # ---------------------------
+    def _create_session(self) -> ClientSession:
+        """Create HTTP session with a keep-alive connection pool for this host."""
+        if self._ssl_verify:
+            ssl_context = ssl_util.get_default_context()
+        else:
+            ssl_context = ssl_util.get_default_no_verify_context()
+
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+        return ClientSession(
+            connector=TCPConnector(
+                ssl=ssl_context,
+                limit_per_host=self._pool_size,
+                keepalive_timeout=self._keepalive_timeout,
+            ),
+            cookie_jar=CookieJar(unsafe=True),
+            timeout=ClientTimeout(
+                total=None,
+                sock_connect=self._connect_timeout,
+                sock_read=self._read_timeout,
+            ),
+            trace_configs=[trace_config],
+        )
+
+    # ---------------------------
+    #   _request_timeout
+    # ---------------------------
+    def _request_timeout(self, deadline: bool = True) -> ClientTimeout:
+        """Return timeout of the next request, bounded by the RPC deadline.
+
+        Session RPCs pass deadline=False, a login shared between cycles
+        must not inherit the deadline of the cycle that started it.
+        """
+        total = None
+        if deadline and (expires := _DEADLINE.get()) is not None:
+            total = expires - monotonic()
+            if total <= 0:
+                raise DeadlineExceeded
+
+        return ClientTimeout(
+            total=total,
+            sock_connect=self._connect_timeout,
+            sock_read=self._read_timeout,
+        )
+
+    async def _on_connection_create(self, session, context, params) -> None:
+        """Count new sockets."""
+        self.connection_stats["created"] += 1
+
+    async def _on_connection_reuse(self, session, context, params) -> None:
+        """Count reused keep-alive sockets."""
+        self.connection_stats["reused"] += 1
+
+    # ---------------------------
+    #   _record_rpc
+    # ---------------------------
+    def _record_rpc(self, name, elapsed, size=0, error=False, timeout=False) -> None:
+        """Account one RPC in the per service.method statistics."""
+        stats = self.rpc_stats.get(name)
+        if stats is None:
+            stats = self.rpc_stats[name] = {
+                "count": 0,
+                "errors": 0,
+                "timeouts": 0,
+                "time_last": 0.0,
+                "time_max": 0.0,
+                "time_total": 0.0,
+                "bytes_last": 0,
+                "bytes_max": 0,
+                "bytes_total": 0,
+                "histogram": [0] * (len(LATENCY_BUCKETS) + 1),
+            }
+
+        stats["count"] += 1
+        if error:
+            stats["errors"] += 1
+
+        if timeout:
+            stats["timeouts"] += 1
+
+        stats["time_last"] = elapsed
+        stats["time_max"] = max(stats["time_max"], elapsed)
+        stats["time_total"] += elapsed
+        stats["bytes_last"] = size
+        stats["bytes_max"] = max(stats["bytes_max"], size)
+        stats["bytes_total"] += size
+        stats["histogram"][bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    # ---------------------------
+    #   rpc_statistics
+    # ---------------------------
+    def rpc_statistics(self) -> dict:
+        """Return RPC statistics with mean values and labelled histograms."""
+        labels = [f"<={bound}s" for bound in LATENCY_BUCKETS]
+        labels.append(f">{LATENCY_BUCKETS[-1]}s")
+        return {
+            name: {
+                "count": stats["count"],
+                "errors": stats["errors"],
+                "timeouts": stats["timeouts"],
+                "time_mean": round(stats["time_total"] / stats["count"], 4),
+                "time_last": round(stats["time_last"], 4),
+                "time_max": round(stats["time_max"], 4),
+                "bytes_mean": stats["bytes_total"] // stats["count"],
+                "bytes_last": stats["bytes_last"],
+                "bytes_max": stats["bytes_max"],
+                "histogram": dict(zip(labels, stats["histogram"])),
+            }
+            for name, stats in self.rpc_stats.items()
+        }
+
+    # ---------------------------
+    #   slowest_rpc
+    # ---------------------------
+    def slowest_rpc(self) -> tuple:
+        """Return name and mean time of the RPC with the highest mean latency."""
+        slowest, slowest_mean = None, 0.0
+        for name, stats in self.rpc_stats.items():
+            if name == "session.login":
+                continue
+
+            mean = stats["time_total"] / stats["count"]
+            if mean > slowest_mean:
+                slowest, slowest_mean = name, mean
+
+        return slowest, slowest_mean
+
+    # ---------------------------
+    #   async_close
+    # ---------------------------
+    async def async_close(self) -> None:
+        """Close the HTTP session and its connection pool."""
+        if self._renew_callback:
+            self._renew_callback()
+            self._renew_callback = None
+
+        if self._connection:
+            await self._connection.close()
+
+        self._connection = None
+        self._connected = False
+
     # ---------------------------
     #   error_to_strings
     # ---------------------------
@@ -244,15 +956,76 @@ class OpenMediaVaultAPI(object):
         method: str,
         params: dict[str, Any] | None = {},
         options: dict[str, Any] | None = {"updatelastaccess": True},
+    ) -> Optional(list):
+        """Retrieve data from OMV from a worker thread."""
+        return self._run_threadsafe(self.async_query(service, method, params, options))
+
+    def _run_threadsafe(self, coro):
+        """Run a coroutine on the event loop and wait for its result.
+
+        Waiting on the event loop itself would deadlock, so it is refused.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is self._hass.loop:
+            coro.close()
+            raise RuntimeError(
+                "Blocking OpenMediaVault API call from the event loop, "
+                "use the async_ methods instead"
+            )
+
+        return asyncio.run_coroutine_threadsafe(coro, self._hass.loop).result()
+
+    # ---------------------------
+    #   _query_timeout
+    # ---------------------------
+    def _query_timeout(self, name):
+        """Handle a timed out query, disconnect once the host stops answering.
+
+        A single slow RPC keeps the session, so other RPCs are not affected.
+        """
+        self.error = "timeout"
+        self.connection_stats["timeouts"] += 1
+        self._timeouts_in_row += 1
+        _LOGGER.warning("OpenMediaVault %s %s timed out", self._host, name)
+        if self._timeouts_in_row >= TIMEOUT_DISCONNECT:
+            self.disconnect("query", "timeout")
+
+    def _deadline_missed(self, name):
+        """Handle a query cut off by the cycle deadline.
+
+        The deadline is local, it says nothing about the host, so the
+        session is kept and the timeout streak is not touched.
+        """
+        self.connection_stats["deadline_missed"] += 1
+        _LOGGER.debug("OpenMediaVault %s %s missed RPC deadline", self._host, name)
+
+    # ---------------------------
+    #   async_query
+    # ---------------------------
+    async def async_query(
+        self,
+        service: str,
+        method: str,
+        params: dict[str, Any] | None = {},
+        options: dict[str, Any] | None = {"updatelastaccess": True},
+        retry: bool = True,
     ) -> Optional(list):
         """Retrieve data from OMV."""
-        if not self.connection_check():
+        if not await self.async_connection_check():
             return None
 
-        self.lock.acquire()
-        error = False
+        name = f"{service}.{method}"
+        session = self._session_generation
+        data = None
+        response = None
+        size = 0
+        start = monotonic()
         try:
-            _LOGGER.debug(
+            _TRACE(
                 "OpenMediaVault %s query: %s, %s, %s, %s",
                 self._host,
                 service,
@@ -260,53 +1033,87 @@ class OpenMediaVaultAPI(object):
                 params,
                 options,
             )
-            response = self._connection.post(
-                self._resource,
-                data=json.dumps(
-                    {
-                        "service": service,
-                        "method": method,
-                        "params": params,
-                        "options": options,
-                    }
-                ),
-                verify=self._ssl_verify,
-            )
+            if self.query_slots.full():
+                _LOGGER.debug(
+                    "OpenMediaVault %s query queue full, %s rejected", self._host, name
+                )
+                return None
 
-            if response.status_code == 200:
-                data = response.json()
-                _LOGGER.debug("OpenMediaVault %s query response: %s", self._host, data)
-            else:
-                error = True
+            queued = monotonic()
+            async with self.query_slots:
+                start = monotonic()
+                profile_add("queue", queued)
+                async with self._connection.post(
+                    self._resource,
+                    data=json_dumps(
+                        {
+                            "service": service,
+                            "method": method,
+                            "params": params,
+                            "options": options,
+                        }
+                    ),
+                    headers=JSON_HEADERS,
+                    timeout=self._request_timeout(),
+                ) as response:
+                    if response.status == 200:
+                        body = await response.read()
+                        size = len(body)
+                        profile_add("network", start)
+                        decoded = monotonic()
+                        data = json_loads(body)
+                        profile_add("decode", decoded)
+                        _TRACE(
+                            "OpenMediaVault %s query response: %s",
+                            self._host,
+                            LazyRedact(data, TO_REDACT),
+                        )
+
+        except DeadlineExceeded:
+            self._record_rpc(name, monotonic() - start, size, error=True)
+            self._deadline_missed(name)
+            return None
+        except asyncio.TimeoutError:
+            if deadline_passed():
+                self._record_rpc(name, monotonic() - start, size, error=True)
+                self._deadline_missed(name)
+                return None
 
+            self._record_rpc(name, monotonic() - start, size, error=True, timeout=True)
+            self._query_timeout(name)
+            return None
         except (
-            requests.exceptions.ConnectionError,
+            ClientError,
             json.decoder.JSONDecodeError,
         ) as api_error:
+            self._record_rpc(name, monotonic() - start, size, error=True)
             _LOGGER.warning("OpenMediaVault %s unable to fetch data", self._host)
             self.disconnect("query", api_error)
-            self.lock.release()
             return None
         except Exception:
+            self._record_rpc(name, monotonic() - start, size, error=True)
             self.disconnect("query")
-            self.lock.release()
             return None
 
-        # Socket errors
-        if error:
-            try:
-                errorcode = response.status_code
-            except Exception:
-                errorcode = "no_respose"
+        self._record_rpc(
+            name,
+            monotonic() - start,
+            size,
+            error=response.status != 200 or data["error"] is not None,
+        )
 
+        self._timeouts_in_row = 0
+
+        # Socket errors
+        if response.status != 200:
             _LOGGER.warning(
-                "OpenMediaVault %s unable to fetch data (%s)", self._host, errorcode
+                "OpenMediaVault %s unable to fetch data (%s)",
+                self._host,
+                response.status,
             )
 
-            error_code = errorcode
-            self.error = error_code
+            self.error = response.status
             self._connected = False
-            self.lock.release()
             return None
 
         # Api errors
@@ -321,10 +1128,11 @@ class OpenMediaVaultAPI(object):
             ):
                 _LOGGER.debug("OpenMediaVault %s session expired", self._host)
                 self.error = 5001
-                if self.connect():
-                    return self.query(service, method, params, options)
+                if retry and await self._async_refresh_session(session):
+                    self.connection_stats["replayed"] += 1
+                    return await self.async_query(
+                        service, method, params, options, retry=False
+                    )
 
         self.error = None
-        self.lock.release()
-
         return data["response"]
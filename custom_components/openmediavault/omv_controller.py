@@ -1,8 +1,12 @@
 """OpenMediaVault Controller."""
 
 import asyncio
+import logging
 import pytz
 from datetime import datetime, timedelta
+from collections import deque
+from functools import partial
+from time import monotonic, time
 
 from homeassistant.const import (
     CONF_HOST,
@@ -14,26 +18,325 @@ from homeassistant.const import (
 )
 from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 
 from .const import (
     DOMAIN,
-    CONF_SCAN_INTERVAL,
-    DEFAULT_SCAN_INTERVAL,
+    KVM_COMMANDS,
+    KVM_COMMAND_STATES,
     CONF_SMART_DISABLE,
     DEFAULT_SMART_DISABLE,
+    CONF_SMART_INTERVAL,
+    DEFAULT_SMART_INTERVAL,
+    CONF_SMART_SKIP_STANDBY,
+    DEFAULT_SMART_SKIP_STANDBY,
+    CONF_UPDATE_CONCURRENCY,
+    DEFAULT_UPDATE_CONCURRENCY,
+    CONF_POOL_SIZE,
+    DEFAULT_POOL_SIZE,
+    CONF_KEEPALIVE_TIMEOUT,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    CONF_CONNECT_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    CONF_SESSION_LIFETIME,
+    DEFAULT_SESSION_LIFETIME,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    CONF_SCAN_INTERVAL_MIN,
+    DEFAULT_SCAN_INTERVAL_MIN,
+    CONF_SCAN_INTERVAL_MAX,
+    DEFAULT_SCAN_INTERVAL_MAX,
+    CONF_PAGE_SIZE,
+    DEFAULT_PAGE_SIZE,
+    CONF_PROFILE_POLLING,
+    DEFAULT_PROFILE_POLLING,
+    UPDATE_TIERS,
 )
-from .apiparser import parse_api
-from .omv_api import OpenMediaVaultAPI
+from .apiparser import (
+    MISSING_FLAG,
+    parse_api,
+    compile_vals,
+    compile_ensure_vals,
+    flag_missing,
+)
+from .omv_api import OpenMediaVaultAPI, rpc_deadline
+from .helper import CycleProfile, profile_add, profile_current
+
+_LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIME_ZONE = None
 
+SMART_SKIP_DEVICES = ("mmcblk", "sr", "bcache")
+
+# Data paths holding a single item instead of items keyed by uid
+FLAT_DATA_PATHS = ("hwinfo", "stats")
+
+# Adaptive polling: interval factors on change/no change, numeric noise
+# tolerance and values that change on every poll
+ADAPTIVE_SPEEDUP = 0.5
+ADAPTIVE_BACKOFF = 1.5
+ADAPTIVE_TOLERANCE = 0.1
+ADAPTIVE_IGNORE = {
+    "hwinfo": ("uptime", "uptimeEpoch"),
+    "disk": ("smart_updated",),
+    "network": ("rx-current", "tx-current", "rx-previous", "tx-previous"),
+}
+# Absolute noise floor per value, changes within it are never significant,
+# so near zero metrics of an idle NAS do not count as activity
+ADAPTIVE_FLOOR = {
+    "hwinfo": {
+        "cpuUsage": 5.0,
+        "memUsage": 2.0,
+        "memUsed": 64 * 1024 * 1024,
+        "loadAverage_1": 0.5,
+        "loadAverage_5": 0.5,
+        "loadAverage_15": 0.5,
+    },
+    "disk": {"temperature": 2},
+    "network": {"rx": 1000000.0, "tx": 1000000.0},
+}
+
+# Overrun handling: consecutive overruns before a tier interval is stretched
+# and stretch factor
+OVERRUN_LIMIT = 3
+OVERRUN_STRETCH = 1.5
+
+# Deadline in seconds for all RPCs of a hardware info update
+HWINFO_DEADLINE = 60
+
+# Number of poll cycle profiles kept for diagnostics
+PROFILE_CYCLES = 50
+
+# Window in seconds the longest tier update is reported over
+POLL_DURATION_WINDOW = 600
+
+# Consecutive updates a uid must be missing from before it is removed
+REMOVE_AFTER_MISSES = 3
+
+SMART_ATTRIBUTES = [
+    "Raw_Read_Error_Rate",
+    "Spin_Up_Time",
+    "Start_Stop_Count",
+    "Reallocated_Sector_Ct",
+    "Seek_Error_Rate",
+    "Load_Cycle_Count",
+    "UDMA_CRC_Error_Count",
+    "Multi_Zone_Error_Rate",
+]
+
 
 def utc_from_timestamp(timestamp: float) -> datetime:
     """Return a UTC time from a timestamp."""
     return pytz.utc.localize(datetime.utcfromtimestamp(timestamp))
 
 
+VALS_HWINFO = compile_vals(
+    [
+        {"name": "hostname", "default": "unknown"},
+        {"name": "version", "default": "unknown"},
+        {"name": "cpuUsage", "default": 0.0},
+        {"name": "memTotal", "default": 0},
+        {"name": "memUsed", "default": 0},
+        {"name": "loadAverage_1", "source": "loadAverage/1min", "default": 0.0},
+        {"name": "loadAverage_5", "source": "loadAverage/5min", "default": 0.0},
+        {
+            "name": "loadAverage_15",
+            "source": "loadAverage/15min",
+            "default": 0.0,
+        },
+        {"name": "uptime", "default": "0 days 0 hours 0 minutes 0 seconds"},
+        {"name": "configDirty", "type": "bool", "default": False},
+        {"name": "rebootRequired", "type": "bool", "default": False},
+        {"name": "availablePkgUpdates", "default": 0},
+    ]
+)
+
+ENSURE_VALS_HWINFO = compile_ensure_vals(
+    [
+        {"name": "memUsage", "default": 0.0},
+        {"name": "pkgUpdatesAvailable", "type": "bool", "default": False},
+    ]
+)
+
+VALS_DISK = compile_vals(
+    [
+        {"name": "devicename"},
+        {"name": "canonicaldevicefile"},
+        {"name": "size", "default": "unknown"},
+        {"name": "vendor", "default": "unknown"},
+        {"name": "model", "default": "unknown"},
+        {"name": "description", "default": "unknown"},
+        {"name": "serialnumber", "default": "unknown"},
+        {"name": "wwn", "default": "unknown"},
+        {"name": "israid", "type": "bool", "default": False},
+        {"name": "isroot", "type": "bool", "default": False},
+        {"name": "isreadonly", "type": "bool", "default": False},
+    ]
+)
+
+ENSURE_VALS_DISK = compile_ensure_vals(
+    [
+        {"name": "temperature", "default": 0},
+        {"name": "power_state", "default": "unknown"},
+        {"name": "smart_updated", "default": "unknown"},
+        {"name": "Raw_Read_Error_Rate", "default": "unknown"},
+        {"name": "Spin_Up_Time", "default": "unknown"},
+        {"name": "Start_Stop_Count", "default": "unknown"},
+        {"name": "Reallocated_Sector_Ct", "default": "unknown"},
+        {"name": "Seek_Error_Rate", "default": "unknown"},
+        {"name": "Load_Cycle_Count", "default": "unknown"},
+        {"name": "UDMA_CRC_Error_Count", "default": "unknown"},
+        {"name": "Multi_Zone_Error_Rate", "default": "unknown"},
+    ]
+)
+
+VALS_SMART = compile_vals(
+    [
+        {"name": "temperature", "default": 0},
+    ]
+)
+
+VALS_SMART_ATTRIBUTES = compile_vals(
+    [
+        {"name": "attrname"},
+        {"name": "threshold", "default": 0},
+        {"name": "rawvalue", "default": 0},
+    ]
+)
+
+VALS_FS = compile_vals(
+    [
+        {"name": "uuid"},
+        {"name": "parentdevicefile", "default": "unknown"},
+        {"name": "label", "default": "unknown"},
+        {"name": "type", "default": "unknown"},
+        {"name": "mounted", "type": "bool", "default": False},
+        {"name": "devicename", "default": "unknown"},
+        {"name": "available", "default": 0},
+        {"name": "size", "default": 0},
+        {"name": "percentage", "default": 0},
+        {"name": "_readonly", "type": "bool", "default": False},
+        {"name": "_used", "type": "bool", "default": False},
+        {"name": "propreadonly", "type": "bool", "default": False},
+    ]
+)
+
+VALS_SERVICE = compile_vals(
+    [
+        {"name": "name"},
+        {"name": "title", "default": "unknown"},
+        {"name": "enabled", "type": "bool", "default": False},
+        {"name": "running", "type": "bool", "default": False},
+    ]
+)
+
+VALS_PLUGIN = compile_vals(
+    [
+        {"name": "name"},
+        {"name": "installed", "type": "bool", "default": False},
+    ]
+)
+
+VALS_NETWORK = compile_vals(
+    [
+        {"name": "uuid"},
+        {"name": "devicename", "default": "unknown"},
+        {"name": "type", "default": "unknown"},
+        {"name": "method", "default": "unknown"},
+        {"name": "address", "default": "unknown"},
+        {"name": "netmask", "default": "unknown"},
+        {"name": "gateway", "default": "unknown"},
+        {"name": "mtu", "default": 0},
+        {"name": "link", "type": "bool", "default": False},
+        {"name": "wol", "type": "bool", "default": False},
+        {"name": "rx-current", "source": "stats/rx_packets", "default": 0.0},
+        {"name": "tx-current", "source": "stats/tx_packets", "default": 0.0},
+    ]
+)
+
+ENSURE_VALS_NETWORK = compile_ensure_vals(
+    [
+        {"name": "rx-previous", "default": 0.0},
+        {"name": "tx-previous", "default": 0.0},
+        {"name": "rx", "default": 0.0},
+        {"name": "tx", "default": 0.0},
+    ]
+)
+
+VALS_KVM = compile_vals(
+    [
+        {"name": "vmname"},
+        {"name": "type", "source": "virttype", "default": "unknown"},
+        {"name": "memory", "source": "mem", "default": "unknown"},
+        {"name": "cpu", "default": "unknown"},
+        {"name": "state", "default": "unknown"},
+        {"name": "architecture", "source": "arch", "default": "unknown"},
+        {"name": "autostart", "default": "unknown"},
+        {"name": "vncexists", "type": "bool", "default": False},
+        {"name": "spiceexists", "type": "bool", "default": False},
+        {"name": "vncport", "default": "unknown"},
+        {"name": "snapshots", "source": "snaps", "default": "unknown"},
+    ]
+)
+
+VALS_COMPOSE = compile_vals(
+    [
+        {"name": "name"},
+        {"name": "image", "default": "unknown"},
+        {"name": "project", "default": "unknown"},
+        {"name": "service", "default": "unknown"},
+        {"name": "created", "default": "unknown"},
+        {"name": "state", "default": "unknown"},
+    ]
+)
+
+
+# ---------------------------
+#   smart_power_state
+# ---------------------------
+def smart_power_state(entry) -> str:
+    """Return disk power state from a Smart.getList entry.
+
+    OMV reads S.M.A.R.T. data without waking sleeping disks, so a disk in
+    standby is listed without a temperature.
+    """
+    if "temperature" not in entry or entry["temperature"] in ("", None):
+        return "standby"
+
+    return "active"
+
+
+# ---------------------------
+#   significant_change
+# ---------------------------
+def significant_change(previous, current, ignore=(), floor=None) -> bool:
+    """Return True if values changed beyond numeric noise.
+
+    Numeric changes count when they exceed both the relative tolerance
+    and the absolute floor of the value.
+    """
+    floor = floor or {}
+    for key, value in current.items():
+        old = previous.get(key)
+        if key in ignore or old == value:
+            continue
+
+        if (
+            isinstance(value, (int, float))
+            and isinstance(old, (int, float))
+            and not isinstance(value, bool)
+            and abs(value - old)
+            <= max(ADAPTIVE_TOLERANCE * max(abs(value), abs(old)), floor.get(key, 0))
+        ):
+            continue
+
+        return True
+
+    return False
+
+
 # ---------------------------
 #   OMVControllerData
 # ---------------------------
@@ -56,6 +359,7 @@ class OMVControllerData(object):
             "network": {},
             "kvm": {},
             "compose": {},
+            "stats": {},
         }
 
         self.listeners = []
@@ -68,32 +372,161 @@ class OMVControllerData(object):
             config_entry.data[CONF_PASSWORD],
             config_entry.data[CONF_SSL],
             config_entry.data[CONF_VERIFY_SSL],
+            self.option_update_concurrency,
+            self.option_pool_size,
+            self.option_keepalive_timeout,
+            self.option_connect_timeout,
+            self.option_read_timeout,
+            self.option_session_lifetime,
         )
 
-        self._force_update_callback = None
+        self._tier_locks = {tier: asyncio.Lock() for tier in UPDATE_TIERS}
+        self._tier_updates = {
+            "hwinfo": self.async_get_hwinfo,
+            "fs": self.async_get_fs,
+            "disk": self.async_get_smart,
+            "network": self.async_get_network,
+            "service": self.async_get_service,
+            "kvm": self.async_get_kvm,
+            "compose": self.async_get_compose,
+        }
+
+        self._smart_cache = {}
+        self._kvm_commands = []
+        self._kvm_refresh = False
+        self._kvm_batch = None
+        self._kvm_lock = asyncio.Lock()
+        self._snapshots = {path: {} for path in self.data}
+        self._missing = {path: {} for path in self.data}
+        self._pending_changes = set()
+        self._last_connected = None
+        self._network_polled = None
+
+        self.profiles = deque(maxlen=PROFILE_CYCLES)
+        self._tier_durations = deque()
+        self.cycle_stats = {"overrun": 0, "skipped": 0, "circuit_open": 0}
+        self._lock_waiters = 0
+        self._tier_pending = set()
+        self._tier_overruns = {}
+        self._tier_stretch = {}
+        self._tier_intervals = {}
+        self._tier_activity = {}
+        self._force_tier_update_callbacks = {}
         self._force_hwinfo_update_callback = None
 
     # ---------------------------
     #   async_init
     # ---------------------------
     async def async_init(self) -> None:
-        self._force_update_callback = async_track_time_interval(
-            self.hass, self.force_update, self.option_scan_interval
-        )
+        self._tier_activity = {}
+        for tier in UPDATE_TIERS:
+            if self.option_adaptive_polling:
+                self._tier_intervals[tier] = self.option_tier_interval(
+                    tier
+                ).total_seconds()
+                self._schedule_tier_update(tier)
+                continue
+
+            self._track_tier_update(tier)
+
         self._force_hwinfo_update_callback = async_track_time_interval(
             self.hass, self.force_hwinfo_update, timedelta(seconds=3600)
         )
 
     # ---------------------------
-    #   option_scan_interval
+    #   option_tier_interval
+    # ---------------------------
+    def option_tier_interval(self, tier) -> timedelta:
+        """Config entry option scan interval for an update tier."""
+        conf_interval, default_interval = UPDATE_TIERS[tier]
+        scan_interval = self.config_entry.options.get(conf_interval, default_interval)
+        return timedelta(seconds=scan_interval)
+
+    # ---------------------------
+    #   tier_interval
+    # ---------------------------
+    def tier_interval(self, tier) -> timedelta:
+        """Return tier interval, stretched while the NAS cannot keep up."""
+        return max(
+            self.option_tier_interval(tier),
+            timedelta(seconds=self._tier_stretch.get(tier, 0)),
+        )
+
+    # ---------------------------
+    #   option_adaptive_polling
     # ---------------------------
     @property
-    def option_scan_interval(self):
-        """Config entry option scan interval."""
-        scan_interval = self.config_entry.options.get(
-            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+    def option_adaptive_polling(self):
+        """Config entry option adaptive polling."""
+        return self.config_entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+
+    # ---------------------------
+    #   option_scan_interval_min
+    # ---------------------------
+    @property
+    def option_scan_interval_min(self):
+        """Config entry option adaptive polling lower bound in seconds."""
+        return self.config_entry.options.get(
+            CONF_SCAN_INTERVAL_MIN, DEFAULT_SCAN_INTERVAL_MIN
         )
-        return timedelta(seconds=scan_interval)
+
+    # ---------------------------
+    #   option_scan_interval_max
+    # ---------------------------
+    @property
+    def option_scan_interval_max(self):
+        """Config entry option adaptive polling upper bound in seconds."""
+        return self.config_entry.options.get(
+            CONF_SCAN_INTERVAL_MAX, DEFAULT_SCAN_INTERVAL_MAX
+        )
+
+    # ---------------------------
+    #   option_connect_timeout
+    # ---------------------------
+    @property
+    def option_connect_timeout(self):
+        """Config entry option connect timeout in seconds."""
+        return self.config_entry.options.get(
+            CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT
+        )
+
+    # ---------------------------
+    #   option_read_timeout
+    # ---------------------------
+    @property
+    def option_read_timeout(self):
+        """Config entry option read timeout in seconds."""
+        return self.config_entry.options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT)
+
+    # ---------------------------
+    #   option_session_lifetime
+    # ---------------------------
+    @property
+    def option_session_lifetime(self):
+        """Config entry option OMV session lifetime in seconds, 0 to learn it."""
+        return self.config_entry.options.get(
+            CONF_SESSION_LIFETIME, DEFAULT_SESSION_LIFETIME
+        )
+
+    # ---------------------------
+    #   option_profile_polling
+    # ---------------------------
+    @property
+    def option_profile_polling(self):
+        """Config entry option poll cycle profiling."""
+        return self.config_entry.options.get(
+            CONF_PROFILE_POLLING, DEFAULT_PROFILE_POLLING
+        )
+
+    # ---------------------------
+    #   option_page_size
+    # ---------------------------
+    @property
+    def option_page_size(self):
+        """Config entry option page size for list RPCs."""
+        return self.config_entry.options.get(CONF_PAGE_SIZE, DEFAULT_PAGE_SIZE)
 
     # ---------------------------
     #   option_smart_disable
@@ -103,6 +536,54 @@ class OMVControllerData(object):
         """Config entry option smart disable."""
         return self.config_entry.options.get(CONF_SMART_DISABLE, DEFAULT_SMART_DISABLE)
 
+    # ---------------------------
+    #   option_smart_interval
+    # ---------------------------
+    @property
+    def option_smart_interval(self):
+        """Config entry option S.M.A.R.T. attributes interval in seconds."""
+        return self.config_entry.options.get(
+            CONF_SMART_INTERVAL, DEFAULT_SMART_INTERVAL
+        )
+
+    # ---------------------------
+    #   option_smart_skip_standby
+    # ---------------------------
+    @property
+    def option_smart_skip_standby(self):
+        """Config entry option to skip S.M.A.R.T. queries for sleeping disks."""
+        return self.config_entry.options.get(
+            CONF_SMART_SKIP_STANDBY, DEFAULT_SMART_SKIP_STANDBY
+        )
+
+    # ---------------------------
+    #   option_update_concurrency
+    # ---------------------------
+    @property
+    def option_update_concurrency(self):
+        """Config entry option update concurrency."""
+        return self.config_entry.options.get(
+            CONF_UPDATE_CONCURRENCY, DEFAULT_UPDATE_CONCURRENCY
+        )
+
+    # ---------------------------
+    #   option_pool_size
+    # ---------------------------
+    @property
+    def option_pool_size(self):
+        """Config entry option connection pool size."""
+        return self.config_entry.options.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE)
+
+    # ---------------------------
+    #   option_keepalive_timeout
+    # ---------------------------
+    @property
+    def option_keepalive_timeout(self):
+        """Config entry option keep-alive timeout in seconds."""
+        return self.config_entry.options.get(
+            CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT
+        )
+
     # ---------------------------
     #   signal_update
     # ---------------------------
@@ -120,6 +601,15 @@ class OMVControllerData(object):
             unsub_dispatcher()
 
         self.listeners = []
+        for unsub_update in self._force_tier_update_callbacks.values():
+            unsub_update()
+
+        self._force_tier_update_callbacks = {}
+        if self._force_hwinfo_update_callback:
+            self._force_hwinfo_update_callback()
+            self._force_hwinfo_update_callback = None
+
+        await self.api.async_close()
         return True
 
     # ---------------------------
@@ -142,99 +632,491 @@ class OMVControllerData(object):
     # ---------------------------
     async def async_hwinfo_update(self):
         """Update OpenMediaVault hardware info."""
+        profile = self._profile_start("hwinfo")
+        locked = False
         try:
-            await asyncio.wait_for(self.lock.acquire(), timeout=30)
-        except Exception:
-            return
+            if self._circuit_open() or not (locked := await self._async_lock(30)):
+                return
 
-        await self.hass.async_add_executor_job(self.get_hwinfo)
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_plugin)
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_disk)
+            with rpc_deadline(HWINFO_DEADLINE):
+                await self._async_gather(
+                    [
+                        self.async_get_hwinfo(),
+                        self.async_get_plugin(),
+                        self.async_get_disk(),
+                    ]
+                )
 
-        self.lock.release()
+            self._pending_changes.update(("hwinfo", "plugin", "disk"))
+        finally:
+            if locked:
+                self.lock.release()
+
+            self._profile_finish(profile)
 
     # ---------------------------
-    #   force_update
+    #   force_tier_update
     # ---------------------------
     @callback
-    async def force_update(self, _now=None):
-        """Trigger update by timer."""
-        await self.async_update()
+    async def force_tier_update(self, tier, _now=None):
+        """Trigger update of a single tier by timer."""
+        await self.async_update_tier(tier)
+        if tier in self._tier_intervals and tier in self._force_tier_update_callbacks:
+            self._adapt_tier_interval(tier)
+            self._schedule_tier_update(tier)
+
+    # ---------------------------
+    #   _track_tier_update
+    # ---------------------------
+    @callback
+    def _track_tier_update(self, tier):
+        """Schedule fixed interval updates of a tier, replacing the previous timer."""
+        if unsub_update := self._force_tier_update_callbacks.get(tier):
+            unsub_update()
+
+        self._force_tier_update_callbacks[tier] = async_track_time_interval(
+            self.hass,
+            partial(self.force_tier_update, tier),
+            self.tier_interval(tier),
+        )
+
+    # ---------------------------
+    #   _schedule_tier_update
+    # ---------------------------
+    @callback
+    def _schedule_tier_update(self, tier):
+        """Schedule next adaptive update of a tier."""
+        self._force_tier_update_callbacks[tier] = async_call_later(
+            self.hass,
+            self._tier_intervals[tier],
+            partial(self.force_tier_update, tier),
+        )
+
+    # ---------------------------
+    #   _adapt_tier_interval
+    # ---------------------------
+    def _adapt_tier_interval(self, tier):
+        """Shorten tier interval after a change, back off while data is static.
+
+        Bounds are widened to include the configured tier interval.
+        """
+        interval = self.option_tier_interval(tier).total_seconds()
+        lower = min(self.option_scan_interval_min, interval)
+        upper = max(self.option_scan_interval_max, interval)
+        if self._tier_activity.pop(tier, False):
+            interval = self._tier_intervals[tier] * ADAPTIVE_SPEEDUP
+        else:
+            interval = self._tier_intervals[tier] * ADAPTIVE_BACKOFF
+
+        self._tier_intervals[tier] = min(upper, max(lower, interval))
+        _LOGGER.debug(
+            "OpenMediaVault %s %s interval %.0fs",
+            self.host,
+            tier,
+            self._tier_intervals[tier],
+        )
 
     # ---------------------------
     #   async_update
     # ---------------------------
     async def async_update(self):
-        """Update OMV data."""
-        if self.api.has_reconnected():
-            await self.async_hwinfo_update()
+        """Update all OMV data."""
+        profile = self._profile_start("update")
+        locked = False
+        try:
+            if self.api.has_reconnected():
+                await self.async_hwinfo_update()
+
+            if self._circuit_open() or not (locked := await self._async_lock(10)):
+                return
+
+            await asyncio.gather(
+                *(self._async_update_tier(tier) for tier in UPDATE_TIERS)
+            )
+            self._update_stats()
 
+            self._dispatch_update()
+        finally:
+            if locked:
+                self.lock.release()
+
+            self._profile_finish(profile)
+
+    # ---------------------------
+    #   async_update_tier
+    # ---------------------------
+    async def async_update_tier(self, tier):
+        """Update OMV data of a single tier."""
+        profile = self._profile_start(tier)
         try:
-            await asyncio.wait_for(self.lock.acquire(), timeout=10)
-        except Exception:
-            return
+            if self.api.has_reconnected():
+                await self.async_hwinfo_update()
+
+            if await self._async_update_tier(tier):
+                self._update_stats()
+                self._dispatch_update()
+        finally:
+            self._profile_finish(profile)
+
+    # ---------------------------
+    #   _circuit_open
+    # ---------------------------
+    def _circuit_open(self) -> bool:
+        """Return True if the cycle is skipped as OMV is unreachable."""
+        if not self.api.circuit_open():
+            return False
 
-        await self.hass.async_add_executor_job(self.get_hwinfo)
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_fs)
+        self.cycle_stats["circuit_open"] += 1
+        return True
 
-        if not self.option_smart_disable and self.api.connected():
-            await self.hass.async_add_executor_job(self.get_smart)
+    # ---------------------------
+    #   _async_lock
+    # ---------------------------
+    async def _async_lock(self, timeout) -> bool:
+        """Acquire update lock, return False when the cycle is skipped.
+
+        Only one cycle waits for a running one, further cycles are skipped
+        right away, as are cycles still waiting after timeout.
+        """
+        start = monotonic()
+        skipped = False
+        # Running or acquiring cycles plus one waiting, further ones are skipped
+        if self._lock_waiters + self.lock.locked() >= 2:
+            skipped = True
+        else:
+            self._lock_waiters += 1
+            try:
+                await asyncio.wait_for(self.lock.acquire(), timeout=timeout)
+            except Exception:
+                skipped = True
+            finally:
+                self._lock_waiters -= 1
+
+        profile_add("lock_wait", start)
+        if skipped:
+            self.cycle_stats["skipped"] += 1
+            _LOGGER.debug(
+                "OpenMediaVault %s update skipped, previous update still running",
+                self.host,
+            )
+            if profile := profile_current():
+                profile.skipped = True
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_network)
+        return not skipped
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_service)
+    # ---------------------------
+    #   _dispatch_update
+    # ---------------------------
+    def _dispatch_update(self):
+        """Send collected changes to the entities."""
+        start = monotonic()
+        async_dispatcher_send(self.hass, self.signal_update, *self.collect_changes())
+        profile_add("dispatch", start)
+
+    # ---------------------------
+    #   _profile_start
+    # ---------------------------
+    def _profile_start(self, cycle) -> CycleProfile | None:
+        """Start profiling a poll cycle if enabled and not nested in another."""
+        if not self.option_profile_polling or profile_current():
+            return None
+
+        return CycleProfile(cycle)
+
+    # ---------------------------
+    #   _profile_finish
+    # ---------------------------
+    def _profile_finish(self, profile):
+        """Store a finished poll cycle profile."""
+        if profile:
+            self.profiles.append(profile.finish())
+
+    # ---------------------------
+    #   _async_update_tier
+    # ---------------------------
+    async def _async_update_tier(self, tier) -> bool:
+        """Run tier update unless disabled.
+
+        Triggers arriving while the tier still runs are coalesced into a
+        single rerun once it finishes, further triggers are skipped.
+        """
+        if not self.tier_enabled(tier) or self._circuit_open():
+            return False
+
+        if self._tier_locks[tier].locked():
+            self._tier_overrun(tier)
+            return False
+
+        runs = 0
+        async with self._tier_locks[tier]:
+            while not runs or tier in self._tier_pending:
+                self._tier_pending.discard(tier)
+                start = monotonic()
+                # RPCs of a cycle have to finish before the next one is due
+                with rpc_deadline(self.tier_interval(tier).total_seconds()):
+                    await self._async_gather([self._tier_updates[tier]()])
+
+                duration = monotonic() - start
+                self.data["stats"][f"{tier}_duration"] = round(duration, 3)
+                self._tier_durations.append((monotonic(), tier, duration))
+                runs += 1
+
+        if runs == 1:
+            self._tier_overruns[tier] = 0
 
         if (
-            self.api.connected()
-            and "openmediavault-kvm" in self.data["plugin"]
-            and self.data["plugin"]["openmediavault-kvm"]["installed"]
+            runs == 1
+            and tier in self._tier_stretch
+            and duration * OVERRUN_STRETCH
+            < self.option_tier_interval(tier).total_seconds()
         ):
-            await self.hass.async_add_executor_job(self.get_kvm)
+            _LOGGER.info(
+                "OpenMediaVault %s %s keeps up again, interval restored",
+                self.host,
+                tier,
+            )
+            del self._tier_stretch[tier]
+            self._retrack_tier_update(tier)
+
+        # Tier names match the data paths they update
+        self._pending_changes.add(tier)
+        return True
+
+    # ---------------------------
+    #   _tier_overrun
+    # ---------------------------
+    def _tier_overrun(self, tier):
+        """Account trigger of a tier that is still running."""
+        if tier in self._tier_pending:
+            self.cycle_stats["skipped"] += 1
+            _LOGGER.debug("OpenMediaVault %s %s update skipped", self.host, tier)
+            return
+
+        self._tier_pending.add(tier)
+        self.cycle_stats["overrun"] += 1
+        self._tier_overruns[tier] = self._tier_overruns.get(tier, 0) + 1
+        if self._tier_overruns[tier] < OVERRUN_LIMIT:
+            return
+
+        self._tier_overruns[tier] = 0
+        interval = self.tier_interval(tier).total_seconds() * OVERRUN_STRETCH
+        self._tier_stretch[tier] = min(
+            interval,
+            max(
+                self.option_scan_interval_max,
+                self.option_tier_interval(tier).total_seconds(),
+            ),
+        )
+        _LOGGER.warning(
+            "OpenMediaVault %s %s update overruns its interval, stretching to %.0fs",
+            self.host,
+            tier,
+            self.tier_interval(tier).total_seconds(),
+        )
+        self._retrack_tier_update(tier)
+
+    # ---------------------------
+    #   _retrack_tier_update
+    # ---------------------------
+    def _retrack_tier_update(self, tier):
+        """Apply a changed tier interval to a running fixed interval timer."""
         if (
-            self.api.connected()
-            and "openmediavault-compose" in self.data["plugin"]
-            and self.data["plugin"]["openmediavault-compose"]["installed"]
+            tier in self._force_tier_update_callbacks
+            and tier not in self._tier_intervals
         ):
-            await self.hass.async_add_executor_job(self.get_compose)
+            self._track_tier_update(tier)
 
-        async_dispatcher_send(self.hass, self.signal_update)
-        self.lock.release()
+    # ---------------------------
+    #   _update_stats
+    # ---------------------------
+    def _update_stats(self):
+        """Update poll statistics from recent tier updates and the API counters.
+
+        Tiers run on their own intervals, so the poll duration is the
+        longest tier update within POLL_DURATION_WINDOW, not the last one.
+        """
+        stats = self.data["stats"]
+        window_start = monotonic() - POLL_DURATION_WINDOW
+        while self._tier_durations and self._tier_durations[0][0] < window_start:
+            self._tier_durations.popleft()
+
+        if self._tier_durations:
+            _, tier, duration = max(self._tier_durations, key=lambda tmp: tmp[2])
+            stats["poll_duration"] = round(duration, 3)
+            stats["poll_duration_tier"] = tier
+
+        stats["rpc_count"] = sum(tmp["count"] for tmp in self.api.rpc_stats.values())
+        stats["rpc_errors"] = sum(tmp["errors"] for tmp in self.api.rpc_stats.values())
+        stats["logins"] = self.api.connection_stats["logins"]
+        stats["relogins"] = self.api.connection_stats["relogins"]
+        stats["overrun_cycles"] = self.cycle_stats["overrun"]
+        stats["skipped_cycles"] = self.cycle_stats["skipped"]
+        stats["circuit_open_cycles"] = self.cycle_stats["circuit_open"]
+        stats["query_queue_max"] = self.api.query_slots.stats["max_waiting"]
+        stats["query_rejected"] = self.api.query_slots.stats["rejected"]
+
+        slowest, mean = self.api.slowest_rpc()
+        if slowest:
+            stats["slowest_rpc"] = slowest
+            stats["slowest_rpc_mean"] = round(mean * 1000)
+            stats["slowest_rpc_max"] = round(
+                self.api.rpc_stats[slowest]["time_max"] * 1000
+            )
+
+        self._pending_changes.add("stats")
+
+    # ---------------------------
+    #   collect_changes
+    # ---------------------------
+    def collect_changes(self) -> tuple:
+        """Return changed, added and removed uids per data path.
+
+        Compares data paths updated since the last call against the known
+        uid index. Flat data paths report their single item as uid "".
+        A uid is only removed from the data once it was missing from
+        several updates in a row, so a partial response does not drop its
+        entities.
+        Changed is None when all entities need a state write, as their
+        availability changed.
+        """
+        paths, self._pending_changes = self._pending_changes, set()
+        changed, added, removed = {}, {}, {}
+        for path in paths:
+            current = self.data[path]
+            if path in FLAT_DATA_PATHS:
+                current = {"": current}
+
+            previous = self._snapshots[path]
+            active = False
+            missing = {
+                uid: self._missing[path].get(uid, 0) + 1
+                for uid in previous
+                if uid not in current or current[uid].get(MISSING_FLAG)
+            }
+            if tmp := {
+                uid for uid, misses in missing.items() if misses >= REMOVE_AFTER_MISSES
+            }:
+                removed[path] = tmp
+                active = True
+                for uid in tmp:
+                    previous.pop(uid)
+                    missing.pop(uid)
+                    current.pop(uid, None)
+
+            self._missing[path] = missing
+
+            for uid, vals in current.items():
+                if uid not in previous:
+                    added.setdefault(path, set()).add(uid)
+                    active = True
+                elif previous[uid] == vals:
+                    continue
+                else:
+                    changed.setdefault(path, set()).add(uid)
+                    active = active or significant_change(
+                        previous[uid],
+                        vals,
+                        ADAPTIVE_IGNORE.get(path, ()),
+                        ADAPTIVE_FLOOR.get(path),
+                    )
+
+                previous[uid] = dict(vals)
+
+            self._tier_activity[path] = active
+
+        connected = self.connected()
+        if connected != self._last_connected:
+            self._last_connected = connected
+            return None, added, removed
+
+        return changed, added, removed
+
+    # ---------------------------
+    #   tier_enabled
+    # ---------------------------
+    def tier_enabled(self, tier) -> bool:
+        """Return True if tier should be updated."""
+        if tier == "disk":
+            return not self.option_smart_disable
+
+        if tier == "kvm":
+            return self.plugin_installed("openmediavault-kvm")
+
+        if tier == "compose":
+            return self.plugin_installed("openmediavault-compose")
+
+        return True
+
+    # ---------------------------
+    #   _async_gather
+    # ---------------------------
+    async def _async_gather(self, updates):
+        """Run independent data updates concurrently."""
+        results = await asyncio.gather(*updates, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "OpenMediaVault %s update failed: %s", self.host, repr(result)
+                )
 
     # ---------------------------
-    #   get_hwinfo
+    #   _async_query_pages
     # ---------------------------
-    def get_hwinfo(self):
+    async def _async_query_pages(self, service, method):
+        """Yield pages of a list RPC, None if a page could not be fetched."""
+        start = 0
+        while True:
+            tmp = await self.api.async_query(
+                service, method, {"start": start, "limit": self.option_page_size}
+            )
+            if not tmp or "data" not in tmp:
+                yield None
+                return
+
+            yield tmp["data"]
+            start += len(tmp["data"])
+            if not tmp["data"] or start >= tmp.get("total", start):
+                return
+
+    # ---------------------------
+    #   _async_parse_pages
+    # ---------------------------
+    async def _async_parse_pages(self, path, service, method, key, vals):
+        """Parse a paged list RPC into a data path page by page.
+
+        Uids missing from the list are flagged once all pages were fetched.
+        """
+        seen = set()
+        async for page in self._async_query_pages(service, method):
+            if page is None:
+                return
+
+            parse_api(data=self.data[path], source=page, key=key, vals=vals)
+            seen.update(entry[key] for entry in page if entry.get(key))
+
+        flag_missing(self.data[path], seen)
+
+    # ---------------------------
+    #   plugin_installed
+    # ---------------------------
+    def plugin_installed(self, plugin) -> bool:
+        """Return True if OMV plugin is installed."""
+        return (
+            plugin in self.data["plugin"]
+            and self.data["plugin"][plugin]["installed"]
+            and not self.data["plugin"][plugin].get(MISSING_FLAG)
+        )
+
+    # ---------------------------
+    #   async_get_hwinfo
+    # ---------------------------
+    async def async_get_hwinfo(self):
         """Get hardware info from OMV."""
         self.data["hwinfo"] = parse_api(
             data=self.data["hwinfo"],
-            source=self.api.query("System", "getInformation"),
-            vals=[
-                {"name": "hostname", "default": "unknown"},
-                {"name": "version", "default": "unknown"},
-                {"name": "cpuUsage", "default": 0.0},
-                {"name": "memTotal", "default": 0},
-                {"name": "memUsed", "default": 0},
-                {"name": "loadAverage_1", "source": "loadAverage/1min", "default": 0.0},
-                {"name": "loadAverage_5", "source": "loadAverage/5min", "default": 0.0},
-                {
-                    "name": "loadAverage_15",
-                    "source": "loadAverage/15min",
-                    "default": 0.0,
-                },
-                {"name": "uptime", "default": "0 days 0 hours 0 minutes 0 seconds"},
-                {"name": "configDirty", "type": "bool", "default": False},
-                {"name": "rebootRequired", "type": "bool", "default": False},
-                {"name": "availablePkgUpdates", "default": 0},
-            ],
-            ensure_vals=[
-                {"name": "memUsage", "default": 0.0},
-                {"name": "pkgUpdatesAvailable", "type": "bool", "default": False},
-            ],
+            source=await self.api.async_query("System", "getInformation"),
+            vals=VALS_HWINFO,
+            ensure_vals=ENSURE_VALS_HWINFO,
         )
 
         if not self.api.connected():
@@ -284,139 +1166,144 @@ class OMVControllerData(object):
         )
 
     # ---------------------------
-    #   get_disk
+    #   async_get_disk
     # ---------------------------
-    def get_disk(self):
+    async def async_get_disk(self):
         """Get all filesystems from OMV."""
         self.data["disk"] = parse_api(
             data=self.data["disk"],
-            source=self.api.query("DiskMgmt", "enumerateDevices"),
+            source=await self.api.async_query("DiskMgmt", "enumerateDevices"),
             key="devicename",
-            vals=[
-                {"name": "devicename"},
-                {"name": "canonicaldevicefile"},
-                {"name": "size", "default": "unknown"},
-                {"name": "vendor", "default": "unknown"},
-                {"name": "model", "default": "unknown"},
-                {"name": "description", "default": "unknown"},
-                {"name": "serialnumber", "default": "unknown"},
-                {"name": "wwn", "default": "unknown"},
-                {"name": "israid", "type": "bool", "default": False},
-                {"name": "isroot", "type": "bool", "default": False},
-                {"name": "isreadonly", "type": "bool", "default": False},
-            ],
-            ensure_vals=[
-                {"name": "temperature", "default": 0},
-                {"name": "Raw_Read_Error_Rate", "default": "unknown"},
-                {"name": "Spin_Up_Time", "default": "unknown"},
-                {"name": "Start_Stop_Count", "default": "unknown"},
-                {"name": "Reallocated_Sector_Ct", "default": "unknown"},
-                {"name": "Seek_Error_Rate", "default": "unknown"},
-                {"name": "Load_Cycle_Count", "default": "unknown"},
-                {"name": "UDMA_CRC_Error_Count", "default": "unknown"},
-                {"name": "Multi_Zone_Error_Rate", "default": "unknown"},
-            ],
+            vals=VALS_DISK,
+            purge=True,
+            ensure_vals=ENSURE_VALS_DISK,
         )
 
+        # Disk entries created since the last S.M.A.R.T. query get their
+        # attributes from the cache instead of waiting for the next one
+        for vals in self.data["disk"].values():
+            self._restore_smart_attributes(vals)
+
     # ---------------------------
-    #   get_smart
+    #   async_get_smart
     # ---------------------------
-    def get_smart(self):
+    async def async_get_smart(self):
         """Get S.M.A.R.T. information from OMV."""
-        tmp_smart_get_list = self.api.query(
-            "Smart", "getList", {"start": 0, "limit": -1}
-        )
-        if "data" in tmp_smart_get_list:
-            tmp_smart_get_list = tmp_smart_get_list["data"]
-
-        self.data["disk"] = parse_api(
-            data=self.data["disk"],
-            source=tmp_smart_get_list,
-            key="devicename",
-            vals=[
-                {"name": "temperature", "default": 0},
-            ],
-        )
+        # Summary without the volatile temperature, used to detect changes
+        summaries = {}
+        power_states = {}
+        async for page in self._async_query_pages("Smart", "getList"):
+            if page is None:
+                # Power states are unknown, querying attributes would wake
+                # sleeping disks. Keep previous states until the next cycle.
+                return
+
+            parse_api(
+                data=self.data["disk"],
+                source=page,
+                key="devicename",
+                vals=VALS_SMART,
+            )
+            for entry in page:
+                if "devicename" in entry:
+                    summaries[entry["devicename"]] = {
+                        key: value
+                        for key, value in entry.items()
+                        if key != "temperature"
+                    }
+                    power_states[entry["devicename"]] = smart_power_state(entry)
+
+        devicefiles = set()
+        updates = []
+        for uid, vals in self.data["disk"].items():
+            if vals.get(MISSING_FLAG):
+                continue
 
-        for uid in self.data["disk"]:
-            if self.data["disk"][uid]["devicename"].startswith("mmcblk"):
+            if vals["devicename"].startswith(SMART_SKIP_DEVICES):
                 continue
 
-            if self.data["disk"][uid]["devicename"].startswith("sr"):
+            if vals["wwn"] == "" or vals["wwn"] == "unknown":
                 continue
 
-            if self.data["disk"][uid]["devicename"].startswith("bcache"):
+            devicefile = vals["canonicaldevicefile"]
+            devicefiles.add(devicefile)
+            self._restore_smart_attributes(vals)
+            vals["power_state"] = power_states.get(vals["devicename"], "unknown")
+            if self.option_smart_skip_standby and vals["power_state"] == "standby":
                 continue
 
+            summary = summaries.get(vals["devicename"])
+            cached = self._smart_cache.get(devicefile)
             if (
-                self.data["disk"][uid]["wwn"] == ""
-                or self.data["disk"][uid]["wwn"] == "unknown"
+                cached
+                and cached["summary"] == summary
+                and time() - cached["updated"] < self.option_smart_interval
             ):
                 continue
 
-            tmp_data = parse_api(
-                data={},
-                source=self.api.query(
-                    "Smart",
-                    "getAttributes",
-                    {"devicefile": self.data["disk"][uid]["canonicaldevicefile"]},
-                ),
-                key="attrname",
-                vals=[
-                    {"name": "attrname"},
-                    {"name": "threshold", "default": 0},
-                    {"name": "rawvalue", "default": 0},
-                ],
-            )
-            if not tmp_data:
-                continue
+            updates.append(self._async_get_smart_attributes(uid, devicefile, summary))
 
-            vals = [
-                "Raw_Read_Error_Rate",
-                "Spin_Up_Time",
-                "Start_Stop_Count",
-                "Reallocated_Sector_Ct",
-                "Seek_Error_Rate",
-                "Load_Cycle_Count",
-                "UDMA_CRC_Error_Count",
-                "Multi_Zone_Error_Rate",
-            ]
+        await self._async_gather(updates)
+
+        for devicefile in set(self._smart_cache) - devicefiles:
+            self._smart_cache.pop(devicefile)
 
-            for tmp_val in vals:
-                if tmp_val in tmp_data:
-                    if (
-                        isinstance(tmp_data[tmp_val]["rawvalue"], str)
-                        and " " in tmp_data[tmp_val]["rawvalue"]
-                    ):
-                        tmp_data[tmp_val]["rawvalue"] = tmp_data[tmp_val][
-                            "rawvalue"
-                        ].split(" ")[0]
+    def _restore_smart_attributes(self, vals):
+        """Copy cached S.M.A.R.T. attributes into a disk entry."""
+        if cached := self._smart_cache.get(vals.get("canonicaldevicefile")):
+            vals.update(cached["attributes"])
 
-                    self.data["disk"][uid][tmp_val] = tmp_data[tmp_val]["rawvalue"]
+    # ---------------------------
+    #   _async_get_smart_attributes
+    # ---------------------------
+    async def _async_get_smart_attributes(self, uid, devicefile, summary):
+        """Get S.M.A.R.T. attributes for a single disk."""
+        tmp_data = parse_api(
+            data={},
+            source=await self.api.async_query(
+                "Smart",
+                "getAttributes",
+                {"devicefile": devicefile},
+            ),
+            key="attrname",
+            vals=VALS_SMART_ATTRIBUTES,
+        )
+        if not tmp_data:
+            return
+
+        attributes = {}
+        for tmp_val in SMART_ATTRIBUTES:
+            if tmp_val in tmp_data:
+                if (
+                    isinstance(tmp_data[tmp_val]["rawvalue"], str)
+                    and " " in tmp_data[tmp_val]["rawvalue"]
+                ):
+                    tmp_data[tmp_val]["rawvalue"] = tmp_data[tmp_val]["rawvalue"].split(
+                        " "
+                    )[0]
+
+                attributes[tmp_val] = tmp_data[tmp_val]["rawvalue"]
+
+        attributes["smart_updated"] = utc_from_timestamp(time())
+        self._smart_cache[devicefile] = {
+            "summary": summary,
+            "updated": time(),
+            "attributes": attributes,
+        }
+        if uid in self.data["disk"]:
+            self.data["disk"][uid].update(attributes)
 
     # ---------------------------
-    #   get_fs
+    #   async_get_fs
     # ---------------------------
-    def get_fs(self):
+    async def async_get_fs(self):
         """Get all filesystems from OMV."""
         self.data["fs"] = parse_api(
             data=self.data["fs"],
-            source=self.api.query("FileSystemMgmt", "enumerateFilesystems"),
+            source=await self.api.async_query("FileSystemMgmt", "enumerateFilesystems"),
             key="uuid",
-            vals=[
-                {"name": "uuid"},
-                {"name": "parentdevicefile", "default": "unknown"},
-                {"name": "label", "default": "unknown"},
-                {"name": "type", "default": "unknown"},
-                {"name": "mounted", "type": "bool", "default": False},
-                {"name": "devicename", "default": "unknown"},
-                {"name": "available", "default": 0},
-                {"name": "size", "default": 0},
-                {"name": "percentage", "default": 0},
-                {"name": "_readonly", "type": "bool", "default": False},
-                {"name": "_used", "type": "bool", "default": False},
-                {"name": "propreadonly", "type": "bool", "default": False},
-            ],
+            vals=VALS_FS,
+            purge=True,
             skip=[
                 {"name": "type", "value": "swap"},
                 {"name": "type", "value": "iso9660"},
@@ -424,6 +1311,10 @@ class OMVControllerData(object):
         )
 
         for uid in self.data["fs"]:
+            # Values of missing filesystems were converted already
+            if self.data["fs"][uid].get(MISSING_FLAG):
+                continue
+
             tmp = self.data["fs"][uid]["devicename"]
             self.data["fs"][uid]["devicename"] = tmp[
                 tmp.startswith("mapper/") and len("mapper/") :
@@ -437,85 +1328,70 @@ class OMVControllerData(object):
             )
 
     # ---------------------------
-    #   get_service
+    #   async_get_service
     # ---------------------------
-    def get_service(self):
+    async def async_get_service(self):
         """Get OMV services status"""
-        tmp = self.api.query("Services", "getStatus")
-        if "data" in tmp:
+        tmp = await self.api.async_query("Services", "getStatus")
+        if tmp and "data" in tmp:
             tmp = tmp["data"]
 
         self.data["service"] = parse_api(
             data=self.data["service"],
             source=tmp,
             key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "title", "default": "unknown"},
-                {"name": "enabled", "type": "bool", "default": False},
-                {"name": "running", "type": "bool", "default": False},
-            ],
+            vals=VALS_SERVICE,
+            purge=True,
         )
 
     # ---------------------------
-    #   get_plugin
+    #   async_get_plugin
     # ---------------------------
-    def get_plugin(self):
+    async def async_get_plugin(self):
         """Get OMV plugin status"""
         self.data["plugin"] = parse_api(
             data=self.data["plugin"],
-            source=self.api.query("Plugin", "enumeratePlugins"),
+            source=await self.api.async_query("Plugin", "enumeratePlugins"),
             key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "installed", "type": "bool", "default": False},
-            ],
+            vals=VALS_PLUGIN,
+            purge=True,
         )
 
     # ---------------------------
-    #   get_network
+    #   async_get_network
     # ---------------------------
-    def get_network(self):
+    async def async_get_network(self):
         """Get OMV plugin status"""
         self.data["network"] = parse_api(
             data=self.data["network"],
-            source=self.api.query("Network", "enumerateDevices"),
+            source=await self.api.async_query("Network", "enumerateDevices"),
             key="uuid",
-            vals=[
-                {"name": "uuid"},
-                {"name": "devicename", "default": "unknown"},
-                {"name": "type", "default": "unknown"},
-                {"name": "method", "default": "unknown"},
-                {"name": "address", "default": "unknown"},
-                {"name": "netmask", "default": "unknown"},
-                {"name": "gateway", "default": "unknown"},
-                {"name": "mtu", "default": 0},
-                {"name": "link", "type": "bool", "default": False},
-                {"name": "wol", "type": "bool", "default": False},
-                {"name": "rx-current", "source": "stats/rx_packets", "default": 0.0},
-                {"name": "tx-current", "source": "stats/tx_packets", "default": 0.0},
-            ],
-            ensure_vals=[
-                {"name": "rx-previous", "default": 0.0},
-                {"name": "tx-previous", "default": 0.0},
-                {"name": "rx", "default": 0.0},
-                {"name": "tx", "default": 0.0},
-            ],
+            vals=VALS_NETWORK,
+            purge=True,
+            ensure_vals=ENSURE_VALS_NETWORK,
             skip=[
                 {"name": "type", "value": "loopback"},
             ],
         )
 
+        # Rates use the measured time between polls, intervals may be adaptive
+        now = monotonic()
+        elapsed = self.option_tier_interval("network").total_seconds()
+        if self._network_polled:
+            elapsed = now - self._network_polled
+
+        self._network_polled = now
         for uid, vals in self.data["network"].items():
+            if vals.get(MISSING_FLAG):
+                continue
+
             current_tx = vals["tx-current"]
             previous_tx = vals["tx-previous"]
             if not previous_tx:
                 previous_tx = current_tx
 
             delta_tx = max(0, current_tx - previous_tx) * 8
-            self.data["network"][uid]["tx"] = round(
-                delta_tx / self.option_scan_interval.seconds, 2
-            )
+            self.data["network"][uid]["tx"] = round(delta_tx / elapsed, 2)
             self.data["network"][uid]["tx-previous"] = current_tx
 
             current_rx = vals["rx-current"]
@@ -524,58 +1400,102 @@ class OMVControllerData(object):
                 previous_rx = current_rx
 
             delta_rx = max(0, current_rx - previous_rx) * 8
-            self.data["network"][uid]["rx"] = round(
-                delta_rx / self.option_scan_interval.seconds, 2
-            )
+            self.data["network"][uid]["rx"] = round(delta_rx / elapsed, 2)
             self.data["network"][uid]["rx-previous"] = current_rx
 
     # ---------------------------
-    #   get_kvm
+    #   async_get_kvm
     # ---------------------------
-    def get_kvm(self):
+    async def async_get_kvm(self):
         """Get OMV KVM"""
-        tmp = self.api.query("Kvm", "getVmList", {"start": 0, "limit": 999})
-        if "data" not in tmp:
-            return
+        await self._async_parse_pages("kvm", "Kvm", "getVmList", "vmname", VALS_KVM)
 
-        self.data["kvm"] = parse_api(
-            data={},
-            source=tmp["data"],
-            key="vmname",
-            vals=[
-                {"name": "vmname"},
-                {"name": "type", "source": "virttype", "default": "unknown"},
-                {"name": "memory", "source": "mem", "default": "unknown"},
-                {"name": "cpu", "default": "unknown"},
-                {"name": "state", "default": "unknown"},
-                {"name": "architecture", "source": "arch", "default": "unknown"},
-                {"name": "autostart", "default": "unknown"},
-                {"name": "vncexists", "type": "bool", "default": False},
-                {"name": "spiceexists", "type": "bool", "default": False},
-                {"name": "vncport", "default": "unknown"},
-                {"name": "snapshots", "source": "snaps", "default": "unknown"},
-            ],
+    # ---------------------------
+    #   async_kvm_command
+    # ---------------------------
+    async def async_kvm_command(self, vmname, command, refresh=False):
+        """Send Kvm.doCommand to a VM if its state allows it.
+
+        Commands issued together, like a service call targeting many VMs,
+        are checked against the cached VM state in a single pass. With
+        refresh, the VM list is fetched once for the whole batch first.
+        """
+        self._kvm_commands.append((vmname, command))
+        self._kvm_refresh = self._kvm_refresh or refresh
+        if self._kvm_batch is None:
+            self._kvm_batch = self.hass.async_create_task(
+                self._async_run_kvm_commands()
+            )
+
+        await asyncio.shield(self._kvm_batch)
+
+    async def _async_run_kvm_commands(self):
+        """Run all queued VM commands.
+
+        Batches run one after another, so the next batch is checked against
+        the states the commands of the previous one led to.
+        """
+        # Let the other targets of the same service call queue up
+        await asyncio.sleep(0)
+        commands, self._kvm_commands = self._kvm_commands, []
+        refresh, self._kvm_refresh = self._kvm_refresh, False
+        self._kvm_batch = None
+
+        async with self._kvm_lock:
+            if refresh:
+                await self.async_get_kvm()
+                self._pending_changes.add("kvm")
+
+            updates = []
+            for vmname, command in commands:
+                vm = self.data["kvm"].get(vmname)
+                if (
+                    not vm
+                    or vm.get(MISSING_FLAG)
+                    or vm["state"] != KVM_COMMANDS[command]
+                ):
+                    _LOGGER.warning(
+                        "VM %s is not %s",
+                        vmname,
+                        "powered off"
+                        if KVM_COMMANDS[command] == "shutoff"
+                        else "running",
+                    )
+                    continue
+
+                updates.append(self._async_kvm_do_command(vmname, vm, command))
+
+            await self._async_gather(updates)
+
+        if "kvm" in self._pending_changes:
+            self._dispatch_update()
+
+    async def _async_kvm_do_command(self, vmname, vm, command):
+        """Send Kvm.doCommand and assume the VM state it leads to.
+
+        The response carries no result, the next kvm tier update corrects
+        the state if the command failed on the host.
+        """
+        await self.api.async_query(
+            "Kvm",
+            "doCommand",
+            {
+                "command": command,
+                "virttype": f"{vm['type']}",
+                "name": f"{vmname}",
+            },
         )
+        if self.api.error is not None:
+            return
+
+        vm["state"] = KVM_COMMAND_STATES[command]
+        self._pending_changes.add("kvm")
 
     # ---------------------------
-    #   get_compose
+    #   async_get_compose
     # ---------------------------
-    def get_compose(self):
+    async def async_get_compose(self):
         """Get OMV compose"""
-        tmp = self.api.query("compose", "getContainerList", {"start": 0, "limit": 999})
-        if "data" not in tmp:
-            return
-
-        self.data["compose"] = parse_api(
-            data={},
-            source=tmp["data"],
-            key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "image", "default": "unknown"},
-                {"name": "project", "default": "unknown"},
-                {"name": "service", "default": "unknown"},
-                {"name": "created", "default": "unknown"},
-                {"name": "state", "default": "unknown"},
-            ],
+        await self._async_parse_pages(
+            "compose", "compose", "getContainerList", "name", VALS_COMPOSE
         )
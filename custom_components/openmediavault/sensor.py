@@ -102,8 +102,7 @@ class OMVUptimeSensor(OMVSensor):
 
     async def restart(self) -> None:
         """Restart OpenMediaVault systen."""
-        await self.hass.async_add_executor_job(
-            self._ctrl.api.query,
+        await self._ctrl.api.async_query(
             "System",
             "reboot",
             {"delay": 0},
@@ -111,8 +110,7 @@ class OMVUptimeSensor(OMVSensor):
 
     async def stop(self) -> None:
         """Shutdown OpenMediaVault systen."""
-        await self.hass.async_add_executor_job(
-            self._ctrl.api.query,
+        await self._ctrl.api.async_query(
             "System",
             "shutdown",
             {"delay": 0},
@@ -126,93 +124,24 @@ class OMVKVMSensor(OMVSensor):
     """Define an OpenMediaVault VM sensor."""
 
     async def start(self) -> None:
-        """Shutdown OpenMediaVault systen."""
-        tmp = await self.hass.async_add_executor_job(
-            self._ctrl.api.query, "Kvm", "getVmList", {"start": 0, "limit": 999}
-        )
-
-        state = ""
-        if "data" in tmp:
-            for tmp_i in tmp["data"]:
-                if tmp_i["vmname"] == self._data["vmname"]:
-                    state = tmp_i["state"]
-                    break
-
-        if state != "shutoff":
-            _LOGGER.warning("VM %s is not powered off", self._data["vmname"])
-            return
-
-        await self.hass.async_add_executor_job(
-            self._ctrl.api.query,
-            "Kvm",
-            "doCommand",
-            {
-                "command": "poweron",
-                "virttype": f"{self._data['type']}",
-                "name": f"{self._data['vmname']}",
-            },
-        )
+        """Power on VM."""
+        await self._ctrl.async_kvm_command(self._uid, "poweron")
 
     async def stop(self) -> None:
-        """Shutdown OpenMediaVault systen."""
-        tmp = await self.hass.async_add_executor_job(
-            self._ctrl.api.query, "Kvm", "getVmList", {"start": 0, "limit": 999}
-        )
-
-        state = ""
-        if "data" in tmp:
-            for tmp_i in tmp["data"]:
-                if tmp_i["vmname"] == self._data["vmname"]:
-                    state = tmp_i["state"]
-                    break
-
-        if state != "running":
-            _LOGGER.warning("VM %s is not running", self._data["vmname"])
-            return
-
-        await self.hass.async_add_executor_job(
-            self._ctrl.api.query,
-            "Kvm",
-            "doCommand",
-            {
-                "command": "poweroff",
-                "virttype": f"{self._data['type']}",
-                "name": f"{self._data['vmname']}",
-            },
-        )
+        """Power off VM."""
+        await self._ctrl.async_kvm_command(self._uid, "poweroff")
 
     async def restart(self) -> None:
-        """Shutdown OpenMediaVault systen."""
-        tmp = await self.hass.async_add_executor_job(
-            self._ctrl.api.query, "Kvm", "getVmList", {"start": 0, "limit": 999}
-        )
+        """Reboot VM."""
+        await self._ctrl.async_kvm_command(self._uid, "reboot")
 
-        state = ""
-        if "data" in tmp:
-            for tmp_i in tmp["data"]:
-                if tmp_i["vmname"] == self._data["vmname"]:
-                    state = tmp_i["state"]
-                    break
-
-        if state != "running":
-            _LOGGER.warning("VM %s is not running", self._data["vmname"])
-            return
-
-        await self.hass.async_add_executor_job(
-            self._ctrl.api.query,
-            "Kvm",
-            "doCommand",
-            {
-                "command": "reboot",
-                "virttype": f"{self._data['type']}",
-                "name": f"{self._data['vmname']}",
-            },
-        )
+    async def kvm_command(self, command, refresh=False) -> None:
+        """Send command to VM, batched with other VMs targeted by the same call."""
+        await self._ctrl.async_kvm_command(self._uid, command, refresh)
 
     async def snapshot(self) -> None:
         """Shutdown OpenMediaVault systen."""
-        await self.hass.async_add_executor_job(
-            self._ctrl.api.query,
+        await self._ctrl.api.async_query(
             "Kvm",
             "addSnapshot",
             {
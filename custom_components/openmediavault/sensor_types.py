@@ -7,7 +7,12 @@ from homeassistant.components.sensor import (
     SensorStateClass,
     SensorEntityDescription,
 )
-from homeassistant.const import PERCENTAGE, UnitOfTemperature, UnitOfDataRate
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfTemperature,
+    UnitOfDataRate,
+    UnitOfTime,
+)
 
 from .const import (
     SCHEMA_SERVICE_SYSTEM_REBOOT,
@@ -22,6 +27,8 @@ from .const import (
     SCHEMA_SERVICE_KVM_RESTART,
     SERVICE_KVM_SNAPSHOT,
     SCHEMA_SERVICE_KVM_SNAPSHOT,
+    SERVICE_KVM_COMMAND,
+    SCHEMA_SERVICE_KVM_COMMAND,
 )
 
 DEVICE_ATTRIBUTES_CPUUSAGE = [
@@ -30,6 +37,31 @@ DEVICE_ATTRIBUTES_CPUUSAGE = [
     "loadAverage_15",
 ]
 
+DEVICE_ATTRIBUTES_POLL = [
+    "poll_duration_tier",
+    "hwinfo_duration",
+    "fs_duration",
+    "disk_duration",
+    "network_duration",
+    "service_duration",
+    "kvm_duration",
+    "compose_duration",
+    "rpc_count",
+    "rpc_errors",
+    "logins",
+    "relogins",
+    "overrun_cycles",
+    "skipped_cycles",
+    "circuit_open_cycles",
+    "query_queue_max",
+    "query_rejected",
+]
+
+DEVICE_ATTRIBUTES_SLOWEST_RPC = [
+    "slowest_rpc_mean",
+    "slowest_rpc_max",
+]
+
 DEVICE_ATTRIBUTES_FS = [
     "size",
     "available",
@@ -62,6 +94,8 @@ DEVICE_ATTRIBUTES_DISK_SMART = [
     "Load_Cycle_Count",
     "UDMA_CRC_Error_Count",
     "Multi_Zone_Error_Rate",
+    "power_state",
+    "smart_updated",
 ]
 
 DEVICE_ATTRIBUTES_NETWORK = [
@@ -161,6 +195,41 @@ SENSOR_TYPES = {
         data_reference="",
         func="OMVUptimeSensor",
     ),
+    "system_pollDuration": OMVSensorEntityDescription(
+        key="system_pollDuration",
+        name="Max poll duration",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        ha_group="System",
+        data_path="stats",
+        data_attribute="poll_duration",
+        data_name="",
+        data_uid="",
+        data_reference="",
+        data_attributes_list=DEVICE_ATTRIBUTES_POLL,
+    ),
+    "system_slowestRpc": OMVSensorEntityDescription(
+        key="system_slowestRpc",
+        name="Slowest RPC",
+        icon="mdi:speedometer-slow",
+        native_unit_of_measurement=None,
+        device_class=None,
+        state_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        ha_group="System",
+        data_path="stats",
+        data_attribute="slowest_rpc",
+        data_name="",
+        data_uid="",
+        data_reference="",
+        data_attributes_list=DEVICE_ATTRIBUTES_SLOWEST_RPC,
+    ),
     "fs": OMVSensorEntityDescription(
         key="fs",
         name="",
@@ -268,4 +337,5 @@ SENSOR_SERVICES = [
     [SERVICE_KVM_STOP, SCHEMA_SERVICE_KVM_STOP, "stop"],
     [SERVICE_KVM_RESTART, SCHEMA_SERVICE_KVM_RESTART, "restart"],
     [SERVICE_KVM_SNAPSHOT, SCHEMA_SERVICE_KVM_SNAPSHOT, "snapshot"],
+    [SERVICE_KVM_COMMAND, SCHEMA_SERVICE_KVM_COMMAND, "kvm_command"],
 ]